@@ -1,21 +1,47 @@
 from __future__ import annotations
 
-import csv
-import json
+import mmap
+import os
+import re
+import tempfile
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import duckdb
+import pyarrow as pa
 
-try:
-    import pandas as pd
-except ImportError:  # pragma: no cover
-    pd = None
+from shared import (
+    ALLOWED_EVENT_NAMES,
+    EVENT_NAME_ERROR,
+    EXPECTED_HEADERS,
+    NATIVE_TIMESTAMP_PATTERN,
+    explain_failures,
+    is_schema_clean,
+    iter_csv_batches,
+    json_loads_ok,
+    parse_timestamp_fallback,
+    project_root,
+    read_csv_header,
+    validate_frame,
+    validation_pool,
+    write_quarantine_csv,
+)
 
-from pydantic import ValidationError
-
-from shared import EXPECTED_HEADERS, RawEvent, iter_csv_rows, project_root
+# Arrow layout of validated rows handed to DuckDB. large_string matches what Polars
+# emits, so the cast below is a no-op instead of a string buffer copy.
+ARROW_SCHEMA = pa.schema(
+    [
+        ("client_id", pa.large_string()),
+        ("timestamp", pa.timestamp("us")),
+        ("event_name", pa.large_string()),
+        ("event_data", pa.large_string()),
+        ("page_url", pa.large_string()),
+        ("referrer", pa.large_string()),
+        ("user_agent", pa.large_string()),
+    ]
+)
 
 
 def _init_db(conn: duckdb.DuckDBPyConnection) -> None:
@@ -49,6 +75,253 @@ def _init_db(conn: duckdb.DuckDBPyConnection) -> None:
     )
 
 
+def _register_functions(conn: duckdb.DuckDBPyConnection) -> None:
+    """The RawEvent fallbacks `_stage_clean_csv` calls for values DuckDB should not decide alone."""
+    conn.create_function(
+        "parse_timestamp_fallback", parse_timestamp_fallback, ["VARCHAR"], "TIMESTAMP", null_handling="special"
+    )
+    conn.create_function("json_loads_ok", json_loads_ok, ["VARCHAR"], "BOOLEAN")
+
+
+def _insert_valid_rows(conn: duckdb.DuckDBPyConnection, source: pa.Table | pa.RecordBatchReader) -> None:
+    """
+    Appends Arrow rows in ARROW_SCHEMA to raw_events without registering a view. The
+    event_data text is minified by json(), so both validation paths store the same JSON.
+    """
+    conn.from_arrow(source).project(
+        "client_id, timestamp, event_name, json(event_data) AS event_data, page_url, referrer, user_agent"
+    ).insert_into("raw_events")
+
+
+# Offset-suffixed timestamps go through TIMESTAMPTZ; a plain TIMESTAMP cast would drop the offset.
+_TZ_SUFFIX_PATTERN = r"\d:\d{2}(:\d{2}(\.\d+)?)?\s*([Zz]|[+-]\d{2}(:?\d{2})?)$"
+
+# JSON that DuckDB's reader accepts but json.loads (RawEvent) rejects: trailing commas and
+# NaN/Infinity spellings other than Python's. Matching values are checked by json_loads_ok.
+_LENIENT_JSON_PATTERN = r",\s*[}\]]|[:\[,]\s*[+-]?(?i:nan|inf)"
+
+# An empty line: Polars and csv.reader read it as a row of nulls, DuckDB's reader skips it.
+_BLANK_LINE_RE = re.compile(rb"\n\r?\n|\r\r")
+
+
+def _required_error_sql(field: str) -> str:
+    return (
+        f"CASE WHEN {field} IS NULL THEN '{field}: required field is null' "
+        f"WHEN trim({field}) = '' THEN '{field}: required field is empty' END"
+    )
+
+
+def _has_blank_lines(csv_path: Path) -> bool:
+    with csv_path.open("rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _BLANK_LINE_RE.search(data) is not None
+
+
+def _stage_clean_csv(conn: duckdb.DuckDBPyConnection, csv_path: Path, headers: list[str]) -> bool:
+    """
+    Reads and validates a schema-clean CSV entirely inside DuckDB into the `_csv_checked`
+    temp table, applying the same rules as `validate_frame`. Returns False when DuckDB
+    cannot parse the file (e.g. ragged rows) so the caller can use the Polars path.
+    Requires the Python functions registered by `_register_functions`.
+    """
+    columns = ", ".join(f"'{h}': 'VARCHAR'" for h in headers)
+    allowed = ", ".join(f"'{n}'" for n in ALLOWED_EVENT_NAMES)
+    event_name_error = EVENT_NAME_ERROR.replace("'", "''")
+    try:
+        conn.execute(
+            f"""
+            CREATE OR REPLACE TEMP TABLE _csv_checked AS
+            WITH src AS (
+              SELECT *, trim(timestamp) AS _ts_raw, trim(event_data) AS _event_data_raw
+              FROM read_csv(
+                ?,
+                header = true,
+                delim = ',',
+                quote = '"',
+                escape = '"',
+                columns = {{{columns}}},
+                nullstr = ['', 'null', 'NULL', 'None'],
+                parallel = true
+              )
+            ),
+            parsed AS (
+              SELECT
+                *,
+                CASE
+                  WHEN NOT regexp_matches(_ts_raw, '{NATIVE_TIMESTAMP_PATTERN}') THEN NULL
+                  WHEN regexp_matches(_ts_raw, '{_TZ_SUFFIX_PATTERN}')
+                    THEN timezone('UTC', TRY_CAST(_ts_raw AS TIMESTAMPTZ))
+                  ELSE TRY_CAST(_ts_raw AS TIMESTAMP)
+                END AS _ts_fast,
+                _event_data_raw IS NULL OR _event_data_raw = '' OR lower(_event_data_raw) = 'null' AS _event_data_empty
+              FROM src
+            ),
+            checked AS (
+              SELECT
+                client_id,
+                page_url,
+                referrer,
+                timestamp,
+                event_name,
+                event_data,
+                user_agent,
+                trim(client_id) AS _client_id,
+                trim(page_url) AS _page_url,
+                trim(user_agent) AS _user_agent,
+                -- Only values DuckDB cannot cast, or may read differently from RawEvent, pay for
+                -- the Python fallbacks.
+                COALESCE(
+                  _ts_fast,
+                  CASE WHEN _ts_fast IS NULL AND _ts_raw <> '' THEN parse_timestamp_fallback(timestamp) END
+                ) AS _timestamp,
+                lower(trim(event_name)) AS _event_name,
+                CASE
+                  WHEN _event_data_empty THEN '{{}}'
+                  WHEN json_valid(_event_data_raw) AND NOT regexp_matches(_event_data_raw, '{_LENIENT_JSON_PATTERN}')
+                    THEN _event_data_raw
+                  WHEN json_loads_ok(_event_data_raw) THEN _event_data_raw
+                END AS _event_data,
+                _event_data_empty,
+                _ts_raw,
+                _event_data_raw
+              FROM parsed
+            )
+            SELECT
+              *,
+              NULLIF(
+                concat_ws(
+                  ' | ',
+                  {_required_error_sql("client_id")},
+                  CASE
+                    WHEN timestamp IS NULL THEN 'timestamp: timestamp is null'
+                    WHEN _ts_raw = '' THEN 'timestamp: timestamp is empty'
+                    WHEN _timestamp IS NULL THEN 'timestamp: timestamp is not a valid datetime'
+                  END,
+                  CASE WHEN _event_name IS NULL OR _event_name NOT IN ({allowed}) THEN '{event_name_error}' END,
+                  CASE
+                    WHEN _event_data IS NULL THEN 'event_data: event_data is not valid JSON'
+                    WHEN NOT _event_data_empty AND NOT starts_with(_event_data_raw, '{{')
+                      THEN 'event_data: event_data JSON must be an object'
+                  END,
+                  {_required_error_sql("page_url")},
+                  {_required_error_sql("user_agent")}
+                ),
+                ''
+              ) AS error_reason
+            FROM checked;
+            """,
+            [str(csv_path)],
+        )
+    except duckdb.InvalidInputException:
+        return False
+    return True
+
+
+def _load_staged_csv(
+    conn: duckdb.DuckDBPyConnection, stage: duckdb.DuckDBPyConnection, out_path: Path
+) -> tuple[int, int, int]:
+    """
+    Moves the rows staged on `stage` by `_stage_clean_csv` into `raw_events` on `conn`.
+    Valid rows stream across as Arrow record batches, so the insert joins the open
+    transaction on `conn` while staging stays outside it.
+    """
+    rows_read, rows_quarantined = stage.execute("SELECT COUNT(*), COUNT(error_reason) FROM _csv_checked;").fetchone()
+    rows_inserted = rows_read - rows_quarantined
+
+    if rows_inserted:
+        staged_valid = stage.execute(
+            """
+            SELECT
+              _client_id AS client_id,
+              _timestamp AS timestamp,
+              _event_name AS event_name,
+              _event_data AS event_data,
+              _page_url AS page_url,
+              referrer,
+              _user_agent AS user_agent
+            FROM _csv_checked
+            WHERE error_reason IS NULL;
+            """
+        ).to_arrow_reader()
+        _insert_valid_rows(conn, staged_valid)
+
+    if rows_quarantined:
+        # The SQL rules only flag failures; RawEvent has the final say and writes the reasons.
+        staged_failures = stage.execute(
+            f"""
+            SELECT {", ".join(EXPECTED_HEADERS)}, error_reason
+            FROM _csv_checked
+            WHERE error_reason IS NOT NULL;
+            """
+        ).pl()
+        rescued_df, quarantine_df = explain_failures(staged_failures)
+        if rescued_df.height:
+            _insert_valid_rows(conn, rescued_df.select(ARROW_SCHEMA.names).to_arrow().cast(ARROW_SCHEMA))
+            rows_inserted += rescued_df.height
+            rows_quarantined -= rescued_df.height
+        if quarantine_df.height:
+            write_quarantine_csv(quarantine_df, out_path)
+
+    stage.execute("DROP TABLE _csv_checked;")
+    return rows_read, rows_inserted, rows_quarantined
+
+
+def _process_one_csv(csv_path: Path, out_path: Path, spool_path: Path) -> tuple[dict[str, Any], int, int, int]:
+    """
+    Reads and validates one file through Polars batch by batch; runs in a worker process.
+    Valid rows are spooled to `spool_path` as an Arrow IPC stream in ARROW_SCHEMA and
+    quarantined rows are appended to `out_path`, so memory stays flat whatever the file
+    size. Returns the header report and the read/valid/quarantined counts.
+    """
+    batches, header_report = iter_csv_batches(csv_path)
+    rows_read = rows_valid = rows_quarantined = 0
+    quarantine_file = None
+    try:
+        with pa.OSFile(str(spool_path), "wb") as sink, pa.ipc.new_stream(sink, ARROW_SCHEMA) as spool:
+            for batch in batches:
+                valid_df, quarantine_df = validate_frame(batch, header_report["absent_when_null"])
+                rows_read += batch.height
+
+                if valid_df.height:
+                    spool.write_table(valid_df.select(ARROW_SCHEMA.names).to_arrow().cast(ARROW_SCHEMA))
+                    rows_valid += valid_df.height
+
+                if quarantine_df.height:
+                    if quarantine_file is None:
+                        quarantine_file = out_path.open("wb")
+                    write_quarantine_csv(quarantine_df, quarantine_file, include_header=rows_quarantined == 0)
+                    rows_quarantined += quarantine_df.height
+    finally:
+        if quarantine_file is not None:
+            quarantine_file.close()
+
+    return header_report, rows_read, rows_valid, rows_quarantined
+
+
+def _load_processed_csv(
+    conn: duckdb.DuckDBPyConnection, filename: str, spool_path: Path, result: tuple[dict[str, Any], int, int, int]
+) -> tuple[int, int, int]:
+    header_report, rows_read, rows_inserted, rows_quarantined = result
+
+    extra_columns = header_report.get("extra_columns", [])
+    if extra_columns:
+        print(f"WARNING: File {filename} has extra columns: {extra_columns}")
+
+    missing_core = header_report.get("missing_core", [])
+    if missing_core:
+        print(f"CRITICAL WARNING: File {filename} is missing core columns: {missing_core}")
+
+    if rows_inserted:
+        # The spool is memory-mapped and streamed into DuckDB batch by batch.
+        with pa.memory_map(str(spool_path)) as source:
+            _insert_valid_rows(conn, pa.ipc.open_stream(source))
+    spool_path.unlink(missing_ok=True)
+
+    return rows_read, rows_inserted, rows_quarantined
+
+
 def main() -> int:
     root = project_root()
     raw_dir = root / "data" / "raw"
@@ -60,94 +333,65 @@ def main() -> int:
     db_path = processed_dir / "puffy_main.db"
     conn = duckdb.connect(str(db_path))
     _init_db(conn)
+    _register_functions(conn)
 
     csv_files = sorted(raw_dir.glob("*.csv"))
+    log_rows: list[tuple] = []
 
-    for csv_path in csv_files:
-        filename = csv_path.name
-        rows, header_report = iter_csv_rows(csv_path)
-
-        extra_columns = header_report.get("extra_columns", [])
-        if extra_columns:
-            print(f"WARNING: File {filename} has extra columns: {extra_columns}")
-
-        missing_core = header_report.get("missing_core", [])
-        if missing_core:
-            print(f"CRITICAL WARNING: File {filename} is missing core columns: {missing_core}")
-
-        rows_read = len(rows)
-        valid_rows: list[dict[str, Any]] = []
-        quarantine_rows: list[dict[str, Any]] = []
-
-        for row in rows:
-            try:
-                model = RawEvent.model_validate(row)
-                record = model.model_dump()
-                record["event_name"] = model.event_name.value
-                record["event_data"] = json.dumps(record["event_data"], separators=(",", ":"))
-                valid_rows.append(record)
-            except ValidationError as exc:
-                failure_row: dict[str, Any] = {k: row.get(k) for k in EXPECTED_HEADERS}
-                summarized_errors: list[str] = []
-                for err in exc.errors(include_url=False):
-                    loc = ".".join(str(p) for p in err.get("loc", ()))
-                    msg = str(err.get("msg", "validation error"))
-                    summary = f"{loc}: {msg}" if loc else msg
-                    summarized_errors.append(summary)
-                failure_row["error_reason"] = " | ".join(summarized_errors)
-                quarantine_rows.append(failure_row)
-
-        rows_inserted = 0
-        if valid_rows:
-            if pd is None:
-                raise RuntimeError("pandas is required for ingestion but is not installed")
-            df = pd.DataFrame(valid_rows, columns=EXPECTED_HEADERS)
-            conn.register("df_valid_rows", df)
-            conn.execute(
-                """
-                INSERT INTO raw_events
-                SELECT
-                  client_id,
-                  timestamp,
-                  event_name,
-                  CAST(event_data AS JSON) AS event_data,
-                  page_url,
-                  referrer,
-                  user_agent
-                FROM df_valid_rows;
-                """
-            )
-            rows_inserted = len(valid_rows)
-
-        rows_quarantined = len(quarantine_rows)
-        if quarantine_rows:
-            out_path = quarantine_dir / f"{Path(filename).stem}_errors.csv"
-            with out_path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=[*EXPECTED_HEADERS, "error_reason"])
-                writer.writeheader()
-                writer.writerows(quarantine_rows)
-
-        status = "COMPLETED"
-        if rows_quarantined and rows_inserted:
-            status = "partial_failure"
-        elif rows_quarantined and not rows_inserted:
-            status = "FAILED"
+    # Files whose headers already match the spec are validated in DuckDB; anything that needs
+    # header normalization, has blank lines, or that DuckDB cannot parse is validated with
+    # Polars in a worker process. Workers only read and validate: every DuckDB write stays here.
+    with (
+        tempfile.TemporaryDirectory(prefix="ingest_spool_") as spool_dir,
+        validation_pool(len(csv_files)) as pool,
+    ):
+        plans: list[tuple[Path, Path, Path, list[str], Optional[Future]]] = []
+        for csv_path in csv_files:
+            out_path = quarantine_dir / f"{csv_path.stem}_errors.csv"
+            spool_path = Path(spool_dir) / f"{csv_path.stem}.arrows"
+            headers = read_csv_header(csv_path)
+            future = None
+            if not is_schema_clean(headers) or _has_blank_lines(csv_path):
+                future = pool.submit(_process_one_csv, csv_path, out_path, spool_path)
+            plans.append((csv_path, out_path, spool_path, headers, future))
 
-        conn.execute(
-            """
-            INSERT INTO pipeline_logs
-              (filename, run_timestamp, rows_read, rows_inserted, rows_quarantined, status)
-            VALUES (?, ?, ?, ?, ?, ?);
-            """,
-            [
-                filename,
-                datetime.utcnow(),
-                rows_read,
-                rows_inserted,
-                rows_quarantined,
-                status,
-            ],
-        )
+        # One transaction for the whole run: per-file inserts and the audit rows commit together.
+        # The DuckDB fast path stages on its own cursor because a failed read_csv (e.g. ragged
+        # rows) would otherwise abort the transaction.
+        stage = conn.cursor()
+        conn.execute("BEGIN TRANSACTION;")
+        try:
+            for csv_path, out_path, spool_path, headers, future in plans:
+                if future is None and _stage_clean_csv(stage, csv_path, headers):
+                    rows_read, rows_inserted, rows_quarantined = _load_staged_csv(conn, stage, out_path)
+                else:
+                    if future is None:
+                        future = pool.submit(_process_one_csv, csv_path, out_path, spool_path)
+                    rows_read, rows_inserted, rows_quarantined = _load_processed_csv(
+                        conn, csv_path.name, spool_path, future.result()
+                    )
+
+                status = "COMPLETED"
+                if rows_quarantined and rows_inserted:
+                    status = "partial_failure"
+                elif rows_quarantined and not rows_inserted:
+                    status = "FAILED"
+
+                log_rows.append((csv_path.name, datetime.utcnow(), rows_read, rows_inserted, rows_quarantined, status))
+
+            if log_rows:
+                conn.executemany(
+                    """
+                    INSERT INTO pipeline_logs
+                      (filename, run_timestamp, rows_read, rows_inserted, rows_quarantined, status)
+                    VALUES (?, ?, ?, ?, ?, ?);
+                    """,
+                    log_rows,
+                )
+            conn.execute("COMMIT;")
+        except Exception:
+            conn.execute("ROLLBACK;")
+            raise
 
     print("Ingestion Complete. Data stored in `puffy_main.db`. Check `pipeline_logs` table for details.")
     return 0
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import csv
 import json
-from datetime import datetime
-from enum import Enum
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import get_context
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, Collection, Iterator, Literal, Optional, get_args
 
 try:
     import polars as pl
@@ -17,16 +23,20 @@ try:
 except ImportError:  # pragma: no cover
     pd = None
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
 
+# The ISO-8601 shapes `datetime.fromisoformat` handles directly; anything else goes to pandas.
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?$")
 
-class EventName(str, Enum):
-    page_viewed = "page_viewed"
-    purchase = "purchase"
-    checkout_started = "checkout_started"
-    checkout_completed = "checkout_completed"
-    product_added_to_cart = "product_added_to_cart"
-    email_filled_on_popup = "email_filled_on_popup"
+
+EventName = Literal[
+    "page_viewed",
+    "purchase",
+    "checkout_started",
+    "checkout_completed",
+    "product_added_to_cart",
+    "email_filled_on_popup",
+]
 
 
 class RawEvent(BaseModel):
@@ -59,21 +69,16 @@ class RawEvent(BaseModel):
             if candidate.endswith("Z"):
                 candidate = candidate[:-1] + "+00:00"
 
-            try:
+            if _ISO_RE.match(raw):
                 return datetime.fromisoformat(candidate)
-            except ValueError:
-                if pd is None:
-                    raise ValueError("timestamp is not a valid datetime") from None
-                parsed = pd.to_datetime(raw, errors="raise")
-                return parsed.to_pydatetime()  # type: ignore[no-any-return]
-
-        if isinstance(value, (int, float)):
             if pd is None:
-                raise ValueError("timestamp numeric provided but pandas unavailable")
-            unit = "ms" if value > 10_000_000_000 else "s"
-            parsed = pd.to_datetime(value, unit=unit, errors="raise")
+                raise ValueError("timestamp is not a valid datetime")
+            parsed = pd.to_datetime(raw, errors="raise")
             return parsed.to_pydatetime()  # type: ignore[no-any-return]
 
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value / (1000 if value > 10_000_000_000 else 1), tz=timezone.utc)
+
         if isinstance(value, bool):
             raise ValueError("timestamp is not a valid datetime")
 
@@ -113,13 +118,6 @@ class RawEvent(BaseModel):
             return parsed
         raise ValueError("event_data must be a JSON string or dict")
 
-    @field_validator("event_name", mode="before")
-    @classmethod
-    def normalize_event_name(cls, value: Any) -> Any:
-        if isinstance(value, str):
-            return value.strip().lower()
-        return value
-
 
 EXPECTED_HEADERS = [
     "client_id",
@@ -130,6 +128,8 @@ EXPECTED_HEADERS = [
     "event_data",
     "user_agent",
 ]
+# Membership checks; the list above keeps the column order for frames and CSV writes.
+EXPECTED_HEADERS_SET: frozenset[str] = frozenset(EXPECTED_HEADERS)
 
 CORE_HEADERS = [
     "client_id",
@@ -142,11 +142,44 @@ CORE_HEADERS = [
 
 _BOM = "\ufeff"
 
+REQUIRED_STRING_FIELDS = ["client_id", "page_url", "user_agent"]
+
+ALLOWED_EVENT_NAMES = list(get_args(EventName))
+EVENT_NAME_ERROR = (
+    "event_name: Input should be "
+    + ", ".join(f"'{n}'" for n in ALLOWED_EVENT_NAMES[:-1])
+    + f" or '{ALLOWED_EVENT_NAMES[-1]}'"
+)
+
+# Timestamps the columnar paths (Polars here, DuckDB in ingest.py) may cast natively: ISO-8601
+# with an in-range time of day. Anything else, such as DuckDB's 'epoch' and 'infinity' or a
+# leap second Polars would roll over, goes through RawEvent.normalize_timestamp.
+NATIVE_TIMESTAMP_PATTERN = (
+    r"^[0-9]{4}-[0-9]{2}-[0-9]{2}[ T]([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](\.[0-9]+)?(Z|[+-][0-9]{2}:?[0-9]{2})?$"
+)
+
+# Timestamp shapes parsed natively by Polars; anything else goes through RawEvent.normalize_timestamp.
+_TIMESTAMP_FORMATS_TZ = ["%Y-%m-%dT%H:%M:%S%.f%#z"]
+_TIMESTAMP_FORMATS_NAIVE = ["%Y-%m-%dT%H:%M:%S%.f"]
+
 
 def project_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+def validation_pool(n_files: int) -> Executor:
+    """
+    Up to one worker process per core (and no more than there are files) for per-file
+    validation. Workers are spawned rather than forked, since forking after Polars has
+    started its thread pool can deadlock. With a single worker the spawn and re-import
+    cost buys nothing, so validation runs in-process on one background thread instead.
+    """
+    workers = min(os.cpu_count() or 1, n_files)
+    if workers <= 1:
+        return ThreadPoolExecutor(max_workers=1)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+
+
 def sanitize_header(name: Any) -> str:
     if name is None:
         return ""
@@ -181,80 +214,264 @@ def normalize_column_name(name: str) -> str:
     return raw
 
 
-def choose_value(existing: Any, candidate: Any) -> Any:
-    if existing is None:
-        return candidate
-    if isinstance(existing, str) and existing.strip() == "":
-        return candidate
-    return existing
+def _require_polars() -> None:
+    if pl is None:
+        raise RuntimeError("polars is required for validation but is not installed")
+
+
+def _non_blank(expr: pl.Expr) -> pl.Expr:
+    return expr.str.strip_chars() != ""
 
 
-def normalize_row(
-    row: dict[str, Any],
+def normalize_frame(
+    df: pl.DataFrame,
     column_map: dict[str, str],
     *,
     derive_timestamp_from_date_time: bool,
-) -> dict[str, Any]:
-    normalized: dict[str, Any] = {}
-    for src_key, value in row.items():
-        norm_key = column_map.get(src_key, normalize_column_name(src_key))
-        normalized[norm_key] = choose_value(normalized.get(norm_key), value)
+) -> pl.DataFrame:
+    """
+    Renames/merges source columns per `column_map` (see `resolve_columns`) and returns
+    a String frame with exactly the EXPECTED_HEADERS columns (missing ones are null).
+    """
+    sources: dict[str, list[str]] = {}
+    for src_key in df.columns:
+        norm_key = column_map[src_key]
+        sources.setdefault(norm_key, []).append(src_key)
+
+    def merged(norm_key: str) -> pl.Expr:
+        cols = sources[norm_key]
+        if len(cols) == 1:
+            return pl.col(cols[0])
+        # When several source columns map to one name, the first non-blank value wins.
+        return pl.coalesce([*(pl.when(_non_blank(pl.col(c))).then(pl.col(c)) for c in cols), pl.col(cols[-1])])
+
+    exprs: list[pl.Expr] = []
+    for norm_key in EXPECTED_HEADERS:
+        if norm_key in sources:
+            exprs.append(merged(norm_key).cast(pl.String).alias(norm_key))
+        elif norm_key == "timestamp" and derive_timestamp_from_date_time:
+            date_part = merged("date").cast(pl.String)
+            time_part = merged("time").cast(pl.String)
+            exprs.append(
+                pl.when(_non_blank(date_part) & _non_blank(time_part))
+                .then(pl.concat_str([date_part, time_part], separator=" "))
+                .when(_non_blank(date_part))
+                .then(date_part)
+                .when(_non_blank(time_part))
+                .then(time_part)
+                .alias("timestamp")
+            )
+        else:
+            exprs.append(pl.lit(None, dtype=pl.String).alias(norm_key))
+
+    return df.select(exprs)
+
 
-    if derive_timestamp_from_date_time and "timestamp" not in normalized:
-        date_part = normalized.get("date")
-        time_part = normalized.get("time")
-        if date_part and time_part:
-            normalized["timestamp"] = f"{date_part} {time_part}"
-        elif date_part:
-            normalized["timestamp"] = date_part
-        elif time_part:
-            normalized["timestamp"] = time_part
+def _to_utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
 
-    return {k: v for k, v in normalized.items() if k in EXPECTED_HEADERS}
 
+def parse_timestamp_fallback(value: str) -> Optional[datetime]:
+    try:
+        parsed = RawEvent.normalize_timestamp(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if not isinstance(parsed, datetime):
+        return None
+    return _to_utc_naive(parsed)
 
-def iter_csv_rows(path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+
+def json_loads_ok(value: str) -> bool:
+    """Whether RawEvent's json.loads accepts `value` (e.g. NaN or 1e400, which stricter parsers reject)."""
+    try:
+        json.loads(value)
+    except (ValueError, RecursionError):
+        return False
+    return True
+
+
+def validate_frame(
+    df: pl.DataFrame, absent_when_null: Collection[str] = ()
+) -> tuple[pl.DataFrame, pl.DataFrame]:
     """
-    Reads CSV rows and returns:
-      - list of row dicts with keys normalized to EXPECTED_HEADERS
-      - a header report {headers, normalized_headers, extra_columns, missing_core}
+    Applies the RawEvent rules to a normalized frame in one columnar pass and returns:
+      - valid rows with cleaned values (EXPECTED_HEADERS columns)
+      - quarantined rows with their original values plus an `error_reason` column
+    `absent_when_null` names the columns the source file did not have (see the header
+    report), so RawEvent reports them as missing rather than null.
     """
-    headers: list[str] = []
-    rows: list[dict[str, Any]] = []
+    _require_polars()
+
+    ts_raw = pl.col("timestamp").str.strip_chars()
+    ts_candidate = pl.when(ts_raw.str.contains("T", literal=True)).then(ts_raw).otherwise(
+        ts_raw.str.replace(" ", "T", literal=True)
+    )
+    ts_parsed = pl.when(ts_raw.str.contains(NATIVE_TIMESTAMP_PATTERN)).then(
+        pl.coalesce(
+            [
+                *(
+                    ts_candidate.str.to_datetime(fmt, strict=False, time_unit="us", time_zone="UTC").dt.replace_time_zone(None)
+                    for fmt in _TIMESTAMP_FORMATS_TZ
+                ),
+                *(ts_candidate.str.to_datetime(fmt, strict=False, time_unit="us") for fmt in _TIMESTAMP_FORMATS_NAIVE),
+            ]
+        )
+    )
+
+    event_data_raw = pl.col("event_data").str.strip_chars()
+    event_data_is_empty = event_data_raw.is_null() | (event_data_raw == "") | (event_data_raw.str.to_lowercase() == "null")
+
+    checked = df.with_columns(
+        [
+            *(pl.col(c).str.strip_chars().alias(f"_{c}") for c in REQUIRED_STRING_FIELDS),
+            ts_parsed.alias("_timestamp"),
+            pl.col("event_name").str.strip_chars().str.to_lowercase().alias("_event_name"),
+            # The JSON text is kept as is; DuckDB minifies it on insert.
+            pl.when(event_data_is_empty)
+            .then(pl.lit("{}"))
+            .when(event_data_raw.str.json_path_match("$").is_not_null())
+            .then(event_data_raw)
+            .alias("_event_data"),
+        ]
+    )
+
+    # Only timestamps Polars could not parse, and JSON its strict parser rejected, pay for
+    # the per-value Python fallback.
+    checked = checked.with_columns(
+        pl.coalesce(
+            [
+                pl.col("_timestamp"),
+                pl.when(pl.col("_timestamp").is_null() & _non_blank(pl.col("timestamp")))
+                .then(pl.col("timestamp"))
+                .map_elements(parse_timestamp_fallback, return_dtype=pl.Datetime("us"), skip_nulls=True),
+            ]
+        ).alias("_timestamp"),
+        pl.when(
+            pl.col("_event_data").is_not_null()
+            | pl.when(pl.col("_event_data").is_null())
+            .then(event_data_raw)
+            .map_elements(json_loads_ok, return_dtype=pl.Boolean, skip_nulls=True)
+        )
+        .then(pl.coalesce(pl.col("_event_data"), event_data_raw))
+        .alias("_event_data"),
+    )
+
+    def required_string_error(field: str) -> pl.Expr:
+        return (
+            pl.when(pl.col(field).is_null())
+            .then(pl.lit(f"{field}: required field is null"))
+            .when(pl.col(f"_{field}") == "")
+            .then(pl.lit(f"{field}: required field is empty"))
+        )
+
+    reasons = [
+        required_string_error("client_id"),
+        pl.when(pl.col("timestamp").is_null())
+        .then(pl.lit("timestamp: timestamp is null"))
+        .when(ts_raw == "")
+        .then(pl.lit("timestamp: timestamp is empty"))
+        .when(pl.col("_timestamp").is_null())
+        .then(pl.lit("timestamp: timestamp is not a valid datetime")),
+        pl.when(pl.col("_event_name").is_null() | ~pl.col("_event_name").is_in(ALLOWED_EVENT_NAMES))
+        .then(pl.lit(EVENT_NAME_ERROR)),
+        pl.when(pl.col("_event_data").is_null())
+        .then(pl.lit("event_data: event_data is not valid JSON"))
+        .when(~event_data_is_empty & ~event_data_raw.str.starts_with("{"))
+        .then(pl.lit("event_data: event_data JSON must be an object")),
+        required_string_error("page_url"),
+        required_string_error("user_agent"),
+    ]
+    err = pl.concat_str(reasons, separator=" | ", ignore_nulls=True)
+    checked = checked.with_columns(pl.when(err != "").then(err).alias("_err"))
+
+    valid_df = checked.filter(pl.col("_err").is_null()).select(
+        [pl.col(c) if c == "referrer" else pl.col(f"_{c}").alias(c) for c in EXPECTED_HEADERS]
+    )
+    quarantine_df = checked.filter(pl.col("_err").is_not_null()).select(
+        [*EXPECTED_HEADERS, pl.col("_err").alias("error_reason")]
+    )
+    rescued_df, quarantine_df = explain_failures(quarantine_df, absent_when_null)
+    if rescued_df.height:
+        valid_df = pl.concat([valid_df, rescued_df])
+    return valid_df, quarantine_df
 
-    if pl is not None:
+
+# Column types of the valid rows returned by validate_frame and explain_failures.
+VALID_SCHEMA = (
+    {c: pl.Datetime("us") if c == "timestamp" else pl.String for c in EXPECTED_HEADERS} if pl is not None else {}
+)
+
+
+def model_error_reason(exc: ValidationError) -> str:
+    """RawEvent's own error summary for a failed row: "<field>: <message> | ..."."""
+    return " | ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in exc.errors(include_url=False)
+    )
+
+
+def explain_failures(
+    quarantine_df: pl.DataFrame, absent_when_null: Collection[str] = ()
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Runs RawEvent on the rows the columnar rules quarantined and returns:
+      - the rows RawEvent accepts after all, cleaned like validate_frame's valid rows
+      - the rest, with `error_reason` replaced by RawEvent's messages, so quarantine files
+        carry the same wording (including parser details) as a per-row Pydantic run
+    Null values in `absent_when_null` columns are left out of the row, so RawEvent reports
+    "Field required" for a column the file did not have. Only failures pay for the model.
+    """
+    if not quarantine_df.height:
+        return pl.DataFrame(schema=VALID_SCHEMA), quarantine_df
+
+    rescued: list[tuple[Any, ...]] = []
+    failed: list[bool] = []
+    reasons: list[Optional[str]] = []
+    for row in quarantine_df.select(EXPECTED_HEADERS).iter_rows(named=True):
         try:
-            df = pl.read_csv(
-                path,
-                ignore_errors=False,
-                infer_schema_length=0,
-                null_values=["", "null", "NULL", "None"],
+            event = RawEvent.model_validate(
+                {k: v for k, v in row.items() if v is not None or k not in absent_when_null}
             )
-            rename_map = {c: sanitize_header(c) for c in df.columns}
-            df = df.rename(rename_map)
-            headers = list(df.columns)
-            rows = list(df.iter_rows(named=True))
-        except Exception:
-            rows = []
+        except ValidationError as exc:
+            failed.append(True)
+            reasons.append(model_error_reason(exc))
+            continue
+        failed.append(False)
+        reasons.append(None)
+        rescued.append(
+            (
+                event.client_id,
+                event.page_url,
+                event.referrer,
+                _to_utc_naive(event.timestamp),
+                event.event_name,
+                json.dumps(event.event_data, separators=(",", ":")),
+                event.user_agent,
+            )
+        )
 
-    if not rows:
-        with path.open("r", newline="", encoding="utf-8-sig") as f:
-            raw_reader = csv.reader(f)
-            try:
-                raw_headers = next(raw_reader)
-            except StopIteration:
-                empty_report = {
-                    "headers": [],
-                    "normalized_headers": [],
-                    "extra_columns": [],
-                    "missing_core": CORE_HEADERS,
-                }
-                return ([], empty_report)
-
-            headers = [sanitize_header(h) for h in raw_headers]
-            dict_reader = csv.DictReader(f, fieldnames=headers)
-            rows = [dict(row) for row in dict_reader]
+    quarantine_df = quarantine_df.with_columns(pl.Series("error_reason", reasons, dtype=pl.String))
+    return (
+        pl.DataFrame(rescued, schema=VALID_SCHEMA, orient="row"),
+        quarantine_df.filter(pl.Series(failed, dtype=pl.Boolean)),
+    )
+
+
+def write_quarantine_csv(df: pl.DataFrame, target: Path | BinaryIO, *, include_header: bool = True) -> None:
+    """Writes quarantined rows the way csv.DictWriter did: minimal quoting, CRLF line endings."""
+    df.write_csv(target, include_header=include_header, separator=",", quote_style="necessary", line_terminator="\r\n")
 
+
+@lru_cache(maxsize=None)
+def resolve_columns(headers: tuple[str, ...]) -> tuple[dict[str, str], tuple[str, ...], bool]:
+    """
+    Resolves a header row once (daily files share a handful of layouts) and returns:
+      - column_map from every header to its canonical name (shared; do not mutate)
+      - the normalized header names
+      - whether `timestamp` must be derived from separate date/time columns
+    """
     normalized_headers = [normalize_column_name(h) for h in headers]
     has_timestamp = "timestamp" in normalized_headers
     has_date = "date" in normalized_headers
@@ -270,27 +487,151 @@ def iter_csv_rows(path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         column_map = {k: ("timestamp" if v == "time" else v) for k, v in column_map.items()}
         normalized_headers = ["timestamp" if h == "time" else h for h in normalized_headers]
 
-    normalized_rows = [
-        normalize_row(row, column_map, derive_timestamp_from_date_time=derive_timestamp_from_date_time)
-        for row in rows
-    ]
+    return column_map, tuple(normalized_headers), derive_timestamp_from_date_time
+
 
+@lru_cache(maxsize=None)
+def _row_picker(headers: tuple[str, ...]) -> tuple[list[str], Callable[[list[str]], tuple]]:
+    """
+    Specializes row extraction for one header layout: returns the distinct column names
+    and a function mapping a csv.reader row to a tuple of their values. Short rows are
+    padded with None and surplus values dropped; a repeated header keeps its last value,
+    as dict(zip(headers, values)) would.
+    """
+    positions = {h: i for i, h in enumerate(headers)}
+    names = list(positions)
+    width = len(headers)
+    if len(positions) == width:
+        pick = tuple
+    else:
+        getter = itemgetter(*positions.values())
+        pick = getter if len(positions) > 1 else (lambda values: (getter(values),))
+
+    def fit(values: list[str]) -> tuple:
+        if len(values) < width:
+            values = values + [None] * (width - len(values))
+        elif len(values) > width:
+            values = values[:width]
+        return pick(values)
+
+    return names, fit
+
+
+def read_csv_header(path: Path) -> list[str]:
+    with path.open("r", newline="", encoding="utf-8-sig") as f:
+        try:
+            return next(csv.reader(f))
+        except StopIteration:
+            return []
+
+
+def is_schema_clean(headers: list[str]) -> bool:
+    """True when a header row needs no sanitizing, renaming, or timestamp derivation."""
+    return sorted(headers) == sorted(EXPECTED_HEADERS)
+
+
+_CSV_NULL_VALUES = ["", "null", "NULL", "None"]
+
+# Rows per frame yielded by iter_csv_batches.
+CSV_BATCH_SIZE = 100_000
+
+
+def _header_report(
+    headers: list[str], normalized_headers: tuple[str, ...], derive_timestamp_from_date_time: bool
+) -> dict[str, Any]:
     effective_header_set = set(normalized_headers)
     if derive_timestamp_from_date_time:
         effective_header_set.add("timestamp")
         effective_header_set.discard("date")
         effective_header_set.discard("time")
 
-    extra_columns = sorted([c for c in effective_header_set if c not in EXPECTED_HEADERS])
+    extra_columns = sorted([c for c in effective_header_set if c not in EXPECTED_HEADERS_SET])
     missing_core = sorted([c for c in CORE_HEADERS if c not in effective_header_set])
 
+    # Columns the file does not have come out of normalize_frame as nulls; so does a derived
+    # timestamp whose date and time are both blank.
+    absent_when_null = [c for c in EXPECTED_HEADERS if c not in effective_header_set]
+    if derive_timestamp_from_date_time:
+        absent_when_null.append("timestamp")
+
+    return {
+        "headers": headers,
+        "normalized_headers": sorted(effective_header_set),
+        "extra_columns": extra_columns,
+        "missing_core": missing_core,
+        "absent_when_null": absent_when_null,
+    }
+
+
+def _stream_batches(
+    path: Path,
+    lazy: Optional[pl.LazyFrame],
+    headers: list[str],
+    batch_size: int,
+) -> Iterator[pl.DataFrame]:
+    column_map, _, derive_timestamp_from_date_time = resolve_columns(tuple(headers))
+    emitted = 0
+    if lazy is not None:
+        try:
+            for batch in lazy.collect_batches(chunk_size=batch_size):
+                batch.columns = headers
+                yield normalize_frame(batch, column_map, derive_timestamp_from_date_time=derive_timestamp_from_date_time)
+                emitted += batch.height
+            return
+        except Exception:
+            pass
+
+    # csv.reader fallback (e.g. ragged rows). It resumes after the records Polars already
+    # produced and reads the rest the way Polars read the start, whatever the batch size:
+    # a blank line is a row of nulls, and _CSV_NULL_VALUES become null.
+    with path.open("r", newline="", encoding="utf-8-sig") as f:
+        raw_reader = csv.reader(f)
+        raw_headers = next(raw_reader, None)
+        if raw_headers is None:
+            return
+        fallback_headers = tuple(sanitize_header(h) for h in raw_headers)
+        column_map, _, derive_timestamp_from_date_time = resolve_columns(fallback_headers)
+        names, fit = _row_picker(fallback_headers)
+        rows = map(fit, islice(raw_reader, emitted, None))
+        while chunk := list(islice(rows, batch_size)):
+            raw_df = pl.DataFrame(chunk, schema={c: pl.String for c in names}, orient="row")
+            del chunk
+            raw_df = raw_df.with_columns(
+                pl.when(pl.col(c).is_in(_CSV_NULL_VALUES)).then(None).otherwise(pl.col(c)).alias(c) for c in names
+            )
+            yield normalize_frame(raw_df, column_map, derive_timestamp_from_date_time=derive_timestamp_from_date_time)
+
+
+def iter_csv_batches(
+    path: Path, batch_size: int = CSV_BATCH_SIZE
+) -> tuple[Iterator[pl.DataFrame], dict[str, Any]]:
+    """
+    Reads a CSV file in batches and returns:
+      - an iterator of String frames of at most `batch_size` rows, with columns normalized
+        to EXPECTED_HEADERS (only one batch is materialized at a time)
+      - a header report {headers, normalized_headers, extra_columns, missing_core, absent_when_null}
+    """
+    _require_polars()
+    lazy: Optional[pl.LazyFrame] = None
+    try:
+        lazy = pl.scan_csv(path, infer_schema_length=0, null_values=_CSV_NULL_VALUES)
+        headers = [sanitize_header(c) for c in lazy.collect_schema().names()]
+    except Exception:
+        lazy = None
+        headers = [sanitize_header(h) for h in read_csv_header(path)]
+
+    if not headers:
+        empty_report = {
+            "headers": [],
+            "normalized_headers": [],
+            "extra_columns": [],
+            "missing_core": CORE_HEADERS,
+            "absent_when_null": EXPECTED_HEADERS,
+        }
+        return iter(()), empty_report
+
+    _, normalized_headers, derive_timestamp_from_date_time = resolve_columns(tuple(headers))
     return (
-        normalized_rows,
-        {
-            "headers": headers,
-            "normalized_headers": sorted(effective_header_set),
-            "extra_columns": extra_columns,
-            "missing_core": missing_core,
-        },
+        _stream_batches(path, lazy, headers, batch_size),
+        _header_report(headers, normalized_headers, derive_timestamp_from_date_time),
     )
-
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import duckdb
+import pytest
+
+import ingest
+
+HEADERS = ["client_id", "page_url", "referrer", "timestamp", "event_name", "event_data", "user_agent"]
+
+EDGE_ROWS = [
+    ["c1", "https://puffy.com/", "", "2025-02-23T10:00:00.000Z", "page_viewed", '{"a": 1, "b": [1, 2]}', "ua"],
+    ["c2", "https://puffy.com/", "https://google.com", "2025-02-23 10:00:00+05:30", "purchase", '{"revenue": NaN}', "ua"],
+    ["c3", "https://puffy.com/", "", "2025-02-23T10:00:00Z", "purchase", '{"revenue": 1e400}', "ua"],
+    ["c4", "https://puffy.com/", "", "2025-02-23T10:00:00Z", "purchase", '{"a": 1,}', "ua"],
+    ["c5", "https://puffy.com/", "", "2025-02-23T10:00:00Z", "purchase", '{"a": nan}', "ua"],
+    ["c6", "https://puffy.com/", "", "infinity", "page_viewed", "{}", "ua"],
+    ["c7", "https://puffy.com/", "", "epoch", "page_viewed", "{}", "ua"],
+    ["c8", "https://puffy.com/", "", "2025-02-23 24:00:00", "page_viewed", "{}", "ua"],
+    ["c9", "https://puffy.com/", "", "2025-02-23 10:00:60", "page_viewed", "{}", "ua"],
+    ["c10", "https://puffy.com/", "", "2025-02-23", "page_viewed", "null", "ua"],
+    ["null", "https://puffy.com/", "", "2025-02-23 10:00:00", "Page_Viewed", "", "ua"],
+    ["c12", "https://puffy.com/", "", "2025-02-23 10:00:00 UTC", "page_viewed", "[1]", "None"],
+]
+
+
+def _write_edge_csv(raw_dir: Path, *, blank_line: bool) -> None:
+    raw_dir.mkdir(parents=True)
+    with (raw_dir / "events_20250223.csv").open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        writer.writerows(EDGE_ROWS[:6])
+        if blank_line:
+            f.write("\r\n")
+        writer.writerows(EDGE_ROWS[6:])
+
+
+def _run_ingest(
+    root: Path, monkeypatch: pytest.MonkeyPatch, *, fast_path: bool, blank_line: bool
+) -> tuple[list, list, bytes]:
+    _write_edge_csv(root / "data" / "raw", blank_line=blank_line)
+    monkeypatch.setattr(ingest, "project_root", lambda: root)
+    monkeypatch.setattr(ingest, "is_schema_clean", ingest.is_schema_clean if fast_path else lambda headers: False)
+    assert ingest.main() == 0
+
+    with duckdb.connect(str(root / "data" / "processed" / "puffy_main.db")) as conn:
+        events = conn.execute(
+            "SELECT client_id, timestamp, event_name, CAST(event_data AS VARCHAR), page_url, referrer, user_agent "
+            "FROM raw_events ORDER BY client_id"
+        ).fetchall()
+        logs = conn.execute(
+            "SELECT filename, rows_read, rows_inserted, rows_quarantined, status FROM pipeline_logs"
+        ).fetchall()
+    quarantine = (root / "data" / "quarantine" / "events_20250223_errors.csv").read_bytes()
+    return events, logs, quarantine
+
+
+@pytest.mark.parametrize("blank_line", [False, True])
+def test_duckdb_fast_path_matches_polars_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, blank_line: bool) -> None:
+    fast = _run_ingest(tmp_path / "fast", monkeypatch, fast_path=True, blank_line=blank_line)
+    slow = _run_ingest(tmp_path / "slow", monkeypatch, fast_path=False, blank_line=blank_line)
+
+    assert fast == slow
+    events, logs, _ = fast
+    assert [e[0] for e in events] == ["c1", "c10", "c2", "c3"]
+    rows_read = len(EDGE_ROWS) + blank_line
+    assert logs == [("events_20250223.csv", rows_read, 4, rows_read - 4, "partial_failure")]
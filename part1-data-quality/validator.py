@@ -1,13 +1,47 @@
 from __future__ import annotations
 
-import csv
 from collections import Counter
 from pathlib import Path
 from typing import Any
 
-from pydantic import ValidationError
-
-from shared import EXPECTED_HEADERS, RawEvent, iter_csv_rows, project_root
+import polars as pl
+
+from shared import iter_csv_batches, project_root, validate_frame, validation_pool, write_quarantine_csv
+
+
+def _validate_one_csv(csv_path: Path, quarantine_dir: Path) -> tuple[dict[str, Any], int, int, Counter[str]]:
+    """
+    Validates one file batch by batch in a worker process, appending quarantined rows to
+    its errors CSV; returns (header_report, passed, failed, reason_counts).
+    """
+    batches, header_report = iter_csv_batches(csv_path)
+    passed = failed = 0
+    reason_counts: Counter[str] = Counter()
+    quarantine_file = None
+    try:
+        for batch in batches:
+            valid_df, quarantine_df = validate_frame(batch, header_report["absent_when_null"])
+            passed += valid_df.height
+            if not quarantine_df.height:
+                continue
+
+            # maintain_order keeps first-seen order, so most_common() breaks ties the same way every run.
+            batch_reasons = (
+                quarantine_df.select(pl.col("error_reason").str.split(" | ").explode())
+                .group_by("error_reason", maintain_order=True)
+                .agg(pl.len())
+            )
+            reason_counts.update(dict(batch_reasons.iter_rows()))
+
+            if quarantine_file is None:
+                quarantine_file = (quarantine_dir / f"{csv_path.stem}_errors.csv").open("wb")
+            write_quarantine_csv(quarantine_df, quarantine_file, include_header=failed == 0)
+            failed += quarantine_df.height
+    finally:
+        if quarantine_file is not None:
+            quarantine_file.close()
+
+    return header_report, passed, failed, reason_counts
 
 
 def main() -> int:
@@ -22,42 +56,23 @@ def main() -> int:
     failed = 0
     error_counts: Counter[str] = Counter()
 
-    for csv_path in csv_files:
-        current_filename = csv_path.name
-        file_failures: list[dict[str, Any]] = []
-        rows, header_report = iter_csv_rows(csv_path)
-
-        extra_columns = header_report.get("extra_columns", [])
-        if extra_columns:
-            print(f"WARNING: File {current_filename} has extra columns: {extra_columns}")
-
-        missing_core = header_report.get("missing_core", [])
-        if missing_core:
-            print(f"CRITICAL WARNING: File {current_filename} is missing core columns: {missing_core}")
-
-        for row in rows:
-            try:
-                RawEvent.model_validate(row)
-                passed += 1
-            except ValidationError as exc:
-                failed += 1
-                failure_row: dict[str, Any] = {k: row.get(k) for k in EXPECTED_HEADERS}
-                summarized_errors: list[str] = []
-                for err in exc.errors(include_url=False):
-                    loc = ".".join(str(p) for p in err.get("loc", ()))
-                    msg = str(err.get("msg", "validation error"))
-                    summary = f"{loc}: {msg}" if loc else msg
-                    summarized_errors.append(summary)
-                    error_counts[summary] += 1
-                failure_row["error_reason"] = " | ".join(summarized_errors)
-                file_failures.append(failure_row)
-
-        if file_failures:
-            out_path = quarantine_dir / f"{Path(current_filename).stem}_errors.csv"
-            with out_path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=[*EXPECTED_HEADERS, "error_reason"])
-                writer.writeheader()
-                writer.writerows(file_failures)
+    with validation_pool(len(csv_files)) as pool:
+        results = pool.map(_validate_one_csv, csv_files, [quarantine_dir] * len(csv_files))
+
+        for csv_path, (header_report, file_passed, file_failed, reason_counts) in zip(csv_files, results):
+            current_filename = csv_path.name
+
+            extra_columns = header_report.get("extra_columns", [])
+            if extra_columns:
+                print(f"WARNING: File {current_filename} has extra columns: {extra_columns}")
+
+            missing_core = header_report.get("missing_core", [])
+            if missing_core:
+                print(f"CRITICAL WARNING: File {current_filename} is missing core columns: {missing_core}")
+
+            passed += file_passed
+            failed += file_failed
+            error_counts.update(reason_counts)
 
     print(
         "Checked "
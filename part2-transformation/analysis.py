@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Sequence
 
 import duckdb
 
@@ -13,25 +14,31 @@ def _project_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def _format_md_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+def _configure_conn(conn: duckdb.DuckDBPyConnection) -> None:
+    raw_memory_gb = os.environ.get("DUCKDB_MEMORY_GB", "4")
+    memory_gb = int(raw_memory_gb) if raw_memory_gb.strip().isdecimal() else 0
+    if memory_gb <= 0:
+        raise ValueError(f"DUCKDB_MEMORY_GB must be a positive whole number of gigabytes, got {raw_memory_gb!r}")
+    conn.execute(f"PRAGMA threads={os.cpu_count() or 1};")
+    conn.execute(f"PRAGMA memory_limit='{memory_gb}GB';")
+
+
+def _section_md(conn: duckdb.DuckDBPyConnection, sql: str) -> str:
+    """
+    Runs a section query and renders it as a Markdown table. Cells are cast and joined
+    into row strings by DuckDB, so Python only stitches the lines together.
+    """
+    rel = conn.sql(sql.strip().rstrip(";"))
+    headers = rel.columns
     if not headers:
         return ""
-    str_rows = [[("" if v is None else str(v)) for v in row] for row in rows]
-    out = []
-    out.append("| " + " | ".join(headers) + " |")
-    out.append("| " + " | ".join(["---"] * len(headers)) + " |")
-    for row in str_rows:
-        out.append("| " + " | ".join(row) + " |")
+    cells = ", ".join("COALESCE(CAST(\"{}\" AS VARCHAR), '')".format(h.replace('"', '""')) for h in headers)
+    rows = rel.project(f"'| ' || concat_ws(' | ', {cells}) || ' |'").fetchall()
+    out = ["| " + " | ".join(headers) + " |", "| " + " | ".join(["---"] * len(headers)) + " |"]
+    out.extend(row[0] for row in rows)
     return "\n".join(out)
 
 
-def _fetch(conn: duckdb.DuckDBPyConnection, sql: str) -> tuple[list[str], list[tuple[Any, ...]]]:
-    cursor = conn.execute(sql)
-    headers = [d[0] for d in cursor.description] if cursor.description else []
-    rows = cursor.fetchall()
-    return headers, rows
-
-
 @dataclass(frozen=True)
 class ReportSection:
     title: str
@@ -54,18 +61,66 @@ def main() -> int:
     findings_path = out_dir / "findings.md"
 
     conn = duckdb.connect(str(db_path))
+    try:
+        _configure_conn(conn)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
+
+    # Shared session rollup, built once and read by every dim_sessions section. It lives in
+    # an attached in-memory database because TEMP tables are not visible to other cursors.
+    conn.execute("ATTACH ':memory:' AS scratch;")
+    try:
+        conn.execute(
+            """
+            CREATE TABLE scratch.session_rollup AS
+            WITH tagged AS (
+                SELECT
+                    CAST(started_at AS DATE) AS day,
+                    platform,
+                    browser,
+                    session_id,
+                    converted,
+                    actions_per_session,
+                    session_duration_minutes,
+                    CASE
+                        WHEN master_user_id IS NULL THEN NULL
+                        WHEN CAST(started_at AS DATE) = MIN(CAST(started_at AS DATE)) OVER (PARTITION BY master_user_id) THEN 'New'
+                        ELSE 'Returning'
+                    END AS user_type
+                FROM dim_sessions
+            )
+            SELECT
+                day,
+                platform,
+                browser,
+                user_type,
+                COUNT(*) AS sessions,
+                COUNT(session_id) AS session_ids,
+                SUM(converted) AS converted_sum,
+                COUNT(converted) AS converted_n,
+                SUM(actions_per_session) AS actions_sum,
+                COUNT(actions_per_session) AS actions_n,
+                COUNT_IF(actions_per_session = 1) AS bounces,
+                SUM(session_duration_minutes) AS duration_sum,
+                COUNT(session_duration_minutes) AS duration_n
+            FROM tagged
+            GROUP BY ALL;
+            """
+        )
+    except duckdb.Error as exc:
+        print(f"ERROR: could not build session rollup: {type(exc).__name__}: {exc}\n")
 
     sections: list[ReportSection] = [
         ReportSection(
             title="## 1. User Engagement & Behavior",
             sql="""
                 SELECT 
-                    COUNT(session_id) as total_sessions,
-                    AVG(session_duration_minutes) as avg_session_duration_min,
-                    AVG(actions_per_session) as avg_actions_per_session,
-                    SUM(CASE WHEN actions_per_session = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as bounce_rate_percent,
-                    SUM(converted) * 100.0 / COUNT(*) as conversion_rate_percent
-                FROM dim_sessions;
+                    COALESCE(SUM(session_ids), 0) as total_sessions,
+                    SUM(duration_sum) / SUM(duration_n) as avg_session_duration_min,
+                    SUM(actions_sum) / SUM(actions_n) as avg_actions_per_session,
+                    SUM(bounces) * 100.0 / SUM(sessions) as bounce_rate_percent,
+                    SUM(converted_sum) * 100.0 / SUM(sessions) as conversion_rate_percent
+                FROM scratch.session_rollup;
                 """.strip(),
         ),
         ReportSection(
@@ -73,9 +128,9 @@ def main() -> int:
             sql="""
                 SELECT 
                     platform,
-                    COUNT(session_id) as session_count,
-                    AVG(converted) * 100.0 as conversion_rate
-                FROM dim_sessions
+                    SUM(session_ids) as session_count,
+                    SUM(converted_sum) / SUM(converted_n) * 100.0 as conversion_rate
+                FROM scratch.session_rollup
                 GROUP BY 1
                 ORDER BY session_count DESC;
                 """.strip(),
@@ -86,9 +141,9 @@ def main() -> int:
                 SELECT 
                     platform,
                     browser,
-                    COUNT(session_id) as session_count,
-                    AVG(converted) * 100.0 as conversion_rate
-                FROM dim_sessions
+                    SUM(session_ids) as session_count,
+                    SUM(converted_sum) / SUM(converted_n) * 100.0 as conversion_rate
+                FROM scratch.session_rollup
                 GROUP BY 1, 2
                 ORDER BY session_count DESC;
                 """.strip(),
@@ -128,10 +183,10 @@ def main() -> int:
             sql="""
                 WITH daily_sessions AS (
                     SELECT
-                        CAST(started_at AS DATE) AS day,
-                        COUNT(*) AS sessions,
-                        SUM(converted) AS converted_sessions
-                    FROM dim_sessions
+                        day,
+                        SUM(sessions) AS sessions,
+                        SUM(converted_sum) AS converted_sessions
+                    FROM scratch.session_rollup
                     GROUP BY 1
                 ),
                 daily_purchases AS (
@@ -159,56 +214,32 @@ def main() -> int:
             title="## 7. First Click vs Last Click Revenue",
             sql="""
                 SELECT
-                model,
-                channel,
-                revenue,
-                orders
-                FROM (
-                SELECT 
-                    'Last Click' AS model,
-                    COALESCE(lc_channel, 'Direct/Unattributed') AS channel,
+                    CASE WHEN GROUPING(lc_channel) = 0 THEN 'Last Click' ELSE 'First Click' END AS model,
+                    CASE WHEN GROUPING(lc_channel) = 0 THEN lc_channel ELSE fc_channel END AS channel,
                     SUM(revenue) AS revenue,
                     COUNT(DISTINCT transaction_id) AS orders
-                FROM fct_attribution
-                GROUP BY 1,2
-                UNION ALL
-                SELECT 
-                    'First Click' AS model,
-                    COALESCE(fc_channel, 'Direct/Unattributed') AS channel,
-                    SUM(revenue) AS revenue,
-                    COUNT(DISTINCT transaction_id) AS orders
-                FROM fct_attribution
-                GROUP BY 1,2
+                FROM (
+                    SELECT
+                        COALESCE(lc_channel, 'Direct/Unattributed') AS lc_channel,
+                        COALESCE(fc_channel, 'Direct/Unattributed') AS fc_channel,
+                        revenue,
+                        transaction_id
+                    FROM fct_attribution
                 ) t
+                GROUP BY GROUPING SETS ((lc_channel), (fc_channel))
                 ORDER BY model, revenue DESC;
                 """.strip(),
         ),
         ReportSection(
             title="## 8. New vs Returning Users",
             sql="""
-                WITH first_day AS (
-                    SELECT
-                        master_user_id,
-                        MIN(CAST(started_at AS DATE)) AS first_session_day
-                    FROM dim_sessions
-                    GROUP BY 1
-                ),
-                tagged AS (
-                    SELECT 
-                        s.*,
-                        CASE 
-                            WHEN CAST(s.started_at AS DATE) = f.first_session_day THEN 'New'
-                            ELSE 'Returning'
-                        END AS user_type
-                    FROM dim_sessions s
-                    JOIN first_day f USING(master_user_id)
-                )
                 SELECT
                     user_type,
-                    COUNT(*) AS sessions,
-                    AVG(converted) * 100.0 AS session_cvr_pct,
-                    AVG(actions_per_session) AS avg_actions
-                FROM tagged
+                    SUM(sessions) AS sessions,
+                    SUM(converted_sum) / SUM(converted_n) * 100.0 AS session_cvr_pct,
+                    SUM(actions_sum) / SUM(actions_n) AS avg_actions
+                FROM scratch.session_rollup
+                WHERE user_type IS NOT NULL
                 GROUP BY 1
                 ORDER BY sessions DESC;
                 """.strip(),
@@ -218,10 +249,16 @@ def main() -> int:
     generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
     md_lines: list[str] = ["# Findings", f"_Generated at: {generated_at}_", ""]
 
+    # Sections are independent reads: run them concurrently on their own cursors and
+    # collect the results in report order.
+    cursors = [conn.cursor() for _ in sections]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_section_md, cur, section.sql) for cur, section in zip(cursors, sections)]
+
     exit_code = 0
-    for section in sections:
+    for section, future in zip(sections, futures):
         try:
-            headers, rows = _fetch(conn, section.sql)
+            table_md = future.result()
         except Exception as exc:
             exit_code = 1
             md_lines.append(section.title)
@@ -232,14 +269,16 @@ def main() -> int:
             continue
 
         print(section.title)
-        print(_format_md_table(headers, rows))
+        print(table_md)
         print("")
 
         md_lines.append(section.title)
-        md_lines.append(_format_md_table(headers, rows))
+        md_lines.append(table_md)
         md_lines.append("")
 
     findings_path.write_text("\n".join(md_lines).strip() + "\n", encoding="utf-8")
+    for cur in cursors:
+        cur.close()
     conn.close()
 
     print(f"Findings written to {findings_path}")
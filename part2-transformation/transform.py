@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, Sequence
+from typing import Any, Callable, Literal, Sequence
 
 import duckdb
 
@@ -13,74 +15,135 @@ def _project_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+_DECL_RE = re.compile(
+    r"(?im)^[ \t]*create[ \t]+or[ \t]+replace[ \t]+(?:temp[ \t]+view|view|table)[ \t]+([a-zA-Z_]\w*)"
+)
+
+
+def _configure_conn(conn: duckdb.DuckDBPyConnection) -> None:
+    raw_memory_gb = os.environ.get("DUCKDB_MEMORY_GB", "4")
+    memory_gb = int(raw_memory_gb) if raw_memory_gb.strip().isdecimal() else 0
+    if memory_gb <= 0:
+        raise ValueError(f"DUCKDB_MEMORY_GB must be a positive whole number of gigabytes, got {raw_memory_gb!r}")
+    conn.execute(f"PRAGMA threads={os.cpu_count() or 1};")
+    conn.execute(f"PRAGMA memory_limit='{memory_gb}GB';")
+
+
 def _declared_objects(sql_text: str) -> list[str]:
-    pattern = re.compile(
-        r"(?im)^[ \t]*create[ \t]+or[ \t]+replace[ \t]+(?:temp[ \t]+view|view|table)[ \t]+([a-zA-Z_][\\w]*)"
-    )
-    seen: set[str] = set()
-    out: list[str] = []
-    for name in pattern.findall(sql_text):
-        if name not in seen:
-            seen.add(name)
-            out.append(name)
-    return out
+    return list(dict.fromkeys(m.group(1) for m in _DECL_RE.finditer(sql_text)))
 
 
 def _execute_sql_script(conn: duckdb.DuckDBPyConnection, sql_text: str) -> None:
+    """
+    Runs the script as one transaction, statement by statement, using DuckDB's own parser
+    to split it (so a ';' inside a string literal is not a statement boundary).
+    """
+    statements = conn.extract_statements(sql_text)
+    conn.begin()
     try:
-        conn.execute(sql_text)
-        return
+        for statement in statements:
+            conn.execute(statement)
+        conn.commit()
     except Exception:
-        pass
-
-    statements = [s.strip() for s in sql_text.split(";") if s.strip()]
-    for statement in statements:
-        conn.execute(statement)
+        conn.rollback()
+        raise
 
 
 CheckType = Literal["zero_rows", "summary", "event_coverage", "diagnostic_dupes"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SqlCheck:
     name: str
     sql: str
     pass_condition: CheckType
 
 
-def _fetch_table(
+def _fetch_head(
     conn: duckdb.DuckDBPyConnection,
     sql: str,
-    *,
-    limit: int | None = None,
-) -> tuple[list[str], list[tuple[Any, ...]]]:
-    limited_sql = sql
-    if limit is not None:
-        limited_sql = f"SELECT * FROM ({sql}) t LIMIT {int(limit)}"
-    cursor = conn.execute(limited_sql)
-    cols = [d[0] for d in cursor.description] if cursor.description else []
+    n: int,
+) -> tuple[int, list[str], list[tuple[Any, ...]]]:
+    """
+    Runs a check query once and returns (total row count, column names, at most the first
+    n rows). Both the count and the LIMIT are evaluated inside DuckDB.
+    """
+    cursor = conn.execute(f"SELECT COUNT(*) OVER () AS _rowcount, * FROM ({sql}) t LIMIT {int(n)}")
+    cols = [d[0] for d in cursor.description[1:]] if cursor.description else []
     rows = cursor.fetchall()
-    return cols, rows
+    rowcount = int(rows[0][0]) if rows else 0
+    return rowcount, cols, [row[1:] for row in rows]
 
 
 def _format_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
     if not headers:
         return "(no columns)"
+    header_cells = [str(h) for h in headers]
     display_rows = [[("" if v is None else str(v)) for v in row] for row in rows]
-    widths = [len(str(h)) for h in headers]
-    for row in display_rows:
-        for i, cell in enumerate(row):
-            widths[i] = max(widths[i], len(cell))
+    # Column-wise max over the transposed cells, one pass per column instead of per cell.
+    widths = [max(map(len, column)) for column in zip(header_cells, *display_rows)]
 
     def fmt_row(cells: Sequence[str]) -> str:
         return " | ".join(cells[i].ljust(widths[i]) for i in range(len(widths)))
 
     sep = "-+-".join("-" * w for w in widths)
-    out = [fmt_row([str(h) for h in headers]), sep]
+    out = [fmt_row(header_cells), sep]
     out.extend(fmt_row(row) for row in display_rows)
     return "\n".join(out)
 
 
+# ----------------------------
+# Check handlers: each appends its report lines to `out` and returns (status, details).
+# ----------------------------
+def _check_summary(conn: duckdb.DuckDBPyConnection, check: SqlCheck, out: list[str]) -> tuple[str, str]:
+    _, headers, rows = _fetch_head(conn, check.sql, 1)
+    out.append(f"\n[PASS] {check.name}")
+    if not rows:
+        return "PASS", "ok"
+    out.append(_format_table(headers, rows))
+    return "PASS", "1 row"
+
+
+def _check_event_coverage(conn: duckdb.DuckDBPyConnection, check: SqlCheck, out: list[str]) -> tuple[str, str]:
+    _, verdict_headers, rows = _fetch_head(
+        conn, f"SELECT COALESCE(unassigned_events = 0, false) AS passed, * FROM ({check.sql}) t", 1
+    )
+    headers = verdict_headers[1:]
+    passed = bool(rows and rows[0][0])
+    unassigned = rows[0][1 + headers.index("unassigned_events")] if rows else None
+    rows = [row[1:] for row in rows]
+    status = "PASS" if passed else "FAIL"
+    out.append(f"\n[{status}] {check.name}")
+    if rows:
+        out.append(_format_table(headers, rows))
+    return status, f"unassigned_events={unassigned}"
+
+
+def _check_diagnostic_dupes(conn: duckdb.DuckDBPyConnection, check: SqlCheck, out: list[str]) -> tuple[str, str]:
+    dupes, headers, rows = _fetch_head(conn, check.sql, 10)
+    out.append(f"\n[PASS] {check.name}")
+    out.append(_format_table(headers, rows) if rows else "(no duplicates)")
+    return "PASS", f"duplicate_pairs={dupes}"
+
+
+def _check_zero_rows(conn: duckdb.DuckDBPyConnection, check: SqlCheck, out: list[str]) -> tuple[str, str]:
+    # Only the sample shown in the log is fetched; the count stays in DuckDB.
+    rowcount, headers, rows = _fetch_head(conn, check.sql, 10)
+    status = "PASS" if rowcount == 0 else "FAIL"
+    out.append(f"\n[{status}] {check.name}")
+    if rows:
+        out.append(_format_table(headers, rows))
+    return status, f"rowcount={rowcount}"
+
+
+_CHECK_HANDLERS: dict[CheckType, Callable[[duckdb.DuckDBPyConnection, SqlCheck, list[str]], tuple[str, str]]] = {
+    "summary": _check_summary,
+    "event_coverage": _check_event_coverage,
+    "diagnostic_dupes": _check_diagnostic_dupes,
+    "zero_rows": _check_zero_rows,
+}
+
+
 def _run_checks(conn: duckdb.DuckDBPyConnection) -> int:
     checks: list[SqlCheck] = [
         SqlCheck(
@@ -93,7 +156,7 @@ SELECT
     COUNT(DISTINCT master_user_id) AS distinct_master_users,
     AVG(session_duration_minutes) AS avg_session_duration_min,
     AVG(actions_per_session) AS avg_actions_per_session,
-    SUM(CASE WHEN actions_per_session = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) AS bounce_rate_percent,
+    COUNT_IF(actions_per_session = 1) * 100.0 / COUNT(*) AS bounce_rate_percent,
     AVG(converted) * 100.0 AS session_conversion_rate_percent
 FROM dim_sessions
 """.strip(),
@@ -102,25 +165,21 @@ FROM dim_sessions
             name="Q2.2.a within-session gap >=30",
             pass_condition="zero_rows",
             sql="""
-WITH events_with_session AS (
+WITH long_gaps AS (
     SELECT
-        s.session_id,
-        e.client_id,
-        e.timestamp,
-        LAG(e.timestamp) OVER (PARTITION BY s.session_id ORDER BY e.timestamp) AS prev_ts
-    FROM stg_events e
-    JOIN dim_sessions s
-      ON e.client_id = s.client_id
-     AND e.timestamp >= s.started_at
-     AND e.timestamp <= s.ended_at
+        session_id,
+        client_id,
+        date_diff('minute', LAG(timestamp) OVER (PARTITION BY session_id ORDER BY timestamp), timestamp) AS gap_minutes
+    FROM _events_x_sessions
+    WHERE session_id IS NOT NULL
+    QUALIFY gap_minutes >= 30
 )
 SELECT 
     session_id,
     client_id,
-    MAX(date_diff('minute', prev_ts, timestamp)) AS max_gap_minutes
-FROM events_with_session
+    MAX(gap_minutes) AS max_gap_minutes
+FROM long_gaps
 GROUP BY 1,2
-HAVING MAX(date_diff('minute', prev_ts, timestamp)) >= 30
 ORDER BY max_gap_minutes DESC
 """.strip(),
         ),
@@ -151,18 +210,11 @@ ORDER BY gap_minutes ASC
             name="Q2.3.a event coverage",
             pass_condition="event_coverage",
             sql="""
-WITH matched AS (
-    SELECT e.client_id, e.timestamp
-    FROM stg_events e
-    JOIN dim_sessions s
-      ON e.client_id = s.client_id
-     AND e.timestamp >= s.started_at
-     AND e.timestamp <= s.ended_at
-)
 SELECT
-    (SELECT COUNT(*) FROM stg_events) AS total_events,
-    (SELECT COUNT(*) FROM matched) AS events_assigned_to_sessions,
-    (SELECT COUNT(*) FROM stg_events) - (SELECT COUNT(*) FROM matched) AS unassigned_events
+    COUNT(DISTINCT ev_key) AS total_events,
+    COUNT(DISTINCT ev_key) FILTER (session_id IS NOT NULL) AS events_assigned_to_sessions,
+    COUNT(DISTINCT ev_key) - COUNT(DISTINCT ev_key) FILTER (session_id IS NOT NULL) AS unassigned_events
+FROM _events_x_sessions
 """.strip(),
         ),
         SqlCheck(
@@ -171,13 +223,10 @@ SELECT
             sql="""
 WITH actual AS (
     SELECT
-        s.session_id,
+        session_id,
         COUNT(*) AS actual_events
-    FROM dim_sessions s
-    JOIN stg_events e
-      ON e.client_id = s.client_id
-     AND e.timestamp >= s.started_at
-     AND e.timestamp <= s.ended_at
+    FROM _events_x_sessions
+    WHERE session_id IS NOT NULL
     GROUP BY 1
 )
 SELECT
@@ -197,9 +246,9 @@ ORDER BY ABS(s.actions_per_session - a.actual_events) DESC
             sql="""
 SELECT
     COUNT(*) AS total_purchases,
-    SUM(CASE WHEN lc_session_id IS NOT NULL THEN 1 ELSE 0 END) AS last_click_attributed,
-    SUM(CASE WHEN fc_session_id IS NOT NULL THEN 1 ELSE 0 END) AS first_click_attributed,
-    SUM(CASE WHEN lc_session_id IS NULL THEN 1 ELSE 0 END) * 100.0 / COUNT(*) AS pct_unattributed_lc
+    COUNT_IF(lc_session_id IS NOT NULL) AS last_click_attributed,
+    COUNT_IF(fc_session_id IS NOT NULL) AS first_click_attributed,
+    COUNT_IF(lc_session_id IS NULL) * 100.0 / COUNT(*) AS pct_unattributed_lc
 FROM fct_attribution
 """.strip(),
         ),
@@ -230,9 +279,9 @@ ORDER BY days_before_purchase DESC
             sql="""
 SELECT
     COUNT(*) AS total_attributed,
-    SUM(CASE WHEN fc_session_id = lc_session_id THEN 1 ELSE 0 END) AS same_session_fc_lc,
-    SUM(CASE WHEN fc_session_id <> lc_session_id THEN 1 ELSE 0 END) AS different_session_fc_lc,
-    SUM(CASE WHEN fc_session_id <> lc_session_id THEN 1 ELSE 0 END) * 100.0 / COUNT(*) AS pct_different
+    COUNT_IF(fc_session_id = lc_session_id) AS same_session_fc_lc,
+    COUNT_IF(fc_session_id <> lc_session_id) AS different_session_fc_lc,
+    COUNT_IF(fc_session_id <> lc_session_id) * 100.0 / COUNT(*) AS pct_different
 FROM fct_attribution
 WHERE fc_session_id IS NOT NULL AND lc_session_id IS NOT NULL
 """.strip(),
@@ -272,61 +321,48 @@ ORDER BY discrepancy DESC
         ),
     ]
 
+    # The report is buffered and written once at the end instead of a print per line.
+    out: list[str] = []
+
+    # Q2.2.a, Q2.3.a and Q2.3.b all need events matched to their session; do the range join once.
+    # It is a LEFT JOIN so unassigned events are kept (session_id NULL) for the coverage count;
+    # ev_key is the stg_events rowid, so an event matched by overlapping sessions is counted once.
+    try:
+        conn.execute(
+            """
+            CREATE OR REPLACE TEMP TABLE _events_x_sessions AS
+            SELECT e.rowid AS ev_key, e.client_id, e.timestamp, s.session_id
+            FROM stg_events e
+            LEFT JOIN dim_sessions s
+              ON e.client_id = s.client_id
+             AND e.timestamp >= s.started_at
+             AND e.timestamp <= s.ended_at;
+            """
+        )
+    except duckdb.Error as exc:
+        out.append(f"ERROR: could not build _events_x_sessions: {type(exc).__name__}: {exc}")
+
     results: list[tuple[str, str, str]] = []
     must_pass_failed = False
 
-    print("\nValidation Checks\n-----------------")
+    out.append("\nValidation Checks\n-----------------")
     for check in checks:
         try:
-            if check.pass_condition == "summary":
-                headers, rows = _fetch_table(conn, check.sql)
-                print(f"\n[PASS] {check.name}")
-                details = "ok"
-                if rows:
-                    print(_format_table(headers, rows[:1]))
-                    details = "1 row"
-                results.append((check.name, "PASS", details))
-
-            elif check.pass_condition == "event_coverage":
-                headers, rows = _fetch_table(conn, check.sql)
-                unassigned = None
-                if rows and "unassigned_events" in headers:
-                    unassigned = rows[0][headers.index("unassigned_events")]
-                status = "PASS" if (unassigned == 0) else "FAIL"
-                print(f"\n[{status}] {check.name}")
-                if rows:
-                    print(_format_table(headers, rows[:1]))
-                details = f"unassigned_events={unassigned}"
-                results.append((check.name, status, details))
-                if status == "FAIL":
-                    must_pass_failed = True
-
-            elif check.pass_condition == "diagnostic_dupes":
-                headers, rows = _fetch_table(conn, check.sql)
-                print(f"\n[PASS] {check.name}")
-                print(_format_table(headers, rows[:10]) if rows else "(no duplicates)")
-                results.append((check.name, "PASS", f"duplicate_pairs={len(rows)}"))
-
-            else:  # zero_rows
-                headers, rows = _fetch_table(conn, check.sql)
-                rowcount = len(rows)
-                status = "PASS" if rowcount == 0 else "FAIL"
-                print(f"\n[{status}] {check.name}")
-                results.append((check.name, status, f"rowcount={rowcount}"))
-                if status == "FAIL":
-                    must_pass_failed = True
-                    if rows:
-                        print(_format_table(headers, rows[:10]))
+            status, details = _CHECK_HANDLERS[check.pass_condition](conn, check, out)
+            results.append((check.name, status, details))
+            if status == "FAIL":
+                must_pass_failed = True
 
         except Exception as exc:
             status = "FAIL"
-            print(f"\n[{status}] {check.name}\nerror={type(exc).__name__}: {exc}")
+            out.append(f"\n[{status}] {check.name}\nerror={type(exc).__name__}: {exc}")
             results.append((check.name, status, f"error={type(exc).__name__}"))
             if check.pass_condition != "diagnostic_dupes":
                 must_pass_failed = True
 
-    print("\nCheck Summary\n-------------")
-    print(_format_table(["check_name", "status", "details"], results))
+    out.append("\nCheck Summary\n-------------")
+    out.append(_format_table(["check_name", "status", "details"], results))
+    sys.stdout.write("\n".join(out) + "\n")
     return 1 if must_pass_failed else 0
 
 
@@ -351,16 +387,21 @@ def main() -> int:
     declared = _declared_objects(sql_text)
 
     conn = duckdb.connect(str(db_path))
-    _execute_sql_script(conn, sql_text)
-
-    if declared:
-        print("Transformation Complete. Created/updated: " + ", ".join(declared) + ".")
-    else:
-        print("Transformation Complete.")
-
-    exit_code = _run_checks(conn)
-    conn.close()
-    return exit_code
+    try:
+        try:
+            _configure_conn(conn)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from None
+        _execute_sql_script(conn, sql_text)
+
+        if declared:
+            print("Transformation Complete. Created/updated: " + ", ".join(declared) + ".")
+        else:
+            print("Transformation Complete.")
+
+        return _run_checks(conn)
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
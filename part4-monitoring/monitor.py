@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 try:
     import duckdb
@@ -12,80 +17,141 @@ except ImportError:  # pragma: no cover
     duckdb = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     name: str
     passed: bool
     details: str
 
 
+def _configure_conn(conn: duckdb.DuckDBPyConnection) -> None:
+    raw_memory_gb = os.environ.get("DUCKDB_MEMORY_GB", "4")
+    memory_gb = int(raw_memory_gb) if raw_memory_gb.strip().isdecimal() else 0
+    if memory_gb <= 0:
+        raise ValueError(f"DUCKDB_MEMORY_GB must be a positive whole number of gigabytes, got {raw_memory_gb!r}")
+    conn.execute(f"PRAGMA threads={os.cpu_count() or 1};")
+    conn.execute(f"PRAGMA memory_limit='{memory_gb}GB';")
+
+
 class DataMonitor:
-    def __init__(self, db_path: Path, project_root: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        project_root: Path,
+        conn: Optional["duckdb.DuckDBPyConnection"] = None,
+    ) -> None:
         if duckdb is None:
             raise RuntimeError("duckdb is not installed (required to run monitoring)")
         self.db_path = db_path
         self.project_root = project_root
         self.quarantine_dir = project_root / "data" / "quarantine"
-        self.conn = duckdb.connect(str(db_path))
+        # A connection passed in belongs to the caller and stays open on close(); one opened here is closed.
+        self._owns_conn = conn is None
+        self.conn = duckdb.connect(str(db_path)) if conn is None else conn
+        self._daily_events_ready = False
+        self._schema: dict[str, set[str]] = {}
+        for table_name, column_name in self.conn.execute(
+            "SELECT table_name, column_name FROM information_schema.columns"
+        ).fetchall():
+            self._schema.setdefault(table_name, set()).add(column_name)
 
     def close(self) -> None:
-        self.conn.close()
+        if self._owns_conn:
+            self.conn.close()
 
     def _table_exists(self, table: str) -> bool:
-        try:
-            self.conn.execute(f"SELECT 1 FROM {table} LIMIT 1")
-            return True
-        except Exception:
-            return False
+        return table in self._schema
 
     def _table_columns(self, table: str) -> set[str]:
-        rows = self.conn.execute(f"PRAGMA table_info('{table}')").fetchall()
-        return {r[1] for r in rows}
+        return self._schema.get(table, set())
 
-    def _fetchone(self, sql: str) -> tuple[list[str], tuple[Any, ...]] | tuple[list[str], tuple[()]]:
-        cursor = self.conn.execute(sql)
-        headers = [d[0] for d in cursor.description] if cursor.description else []
-        row = cursor.fetchone()
-        return headers, (tuple() if row is None else row)
-
-    def _count(self, sql: str) -> int:
-        headers, row = self._fetchone(sql)
-        if not headers or not row:
-            return 0
-        return int(row[0])
+    # ----------------------------
+    # Metric pack: every SQL check contributes one `SELECT day, n1, n2, value` part, and
+    # run_all evaluates all of them in a single round-trip. Event checks read the
+    # mon_daily_events rollup, so the events table is scanned once per run.
+    # ----------------------------
+    def _ensure_daily_events(self) -> None:
+        """
+        Materializes the per-day event rollup (mon_daily_events) once per monitor run; the
+        freshness, volume and missing-revenue checks all read it instead of the events table.
+        """
+        if self._daily_events_ready:
+            return
+        events = self.events_table
+        if "revenue" in self._table_columns(events):
+            missing_revenue = "revenue IS NULL"
+        else:
+            # raw_events.event_data is JSON-typed: probe the revenue keys instead of substring-matching the text.
+            missing_revenue = " AND ".join(
+                f"json_extract_string(event_data, '$.{key}') IS NULL" for key in ("revenue", "value", "price")
+            )
+        is_revenue_event = "event_name = 'purchase' OR event_name = 'checkout_completed'"
+        self.conn.execute(
+            f"""
+            CREATE OR REPLACE TEMP TABLE mon_daily_events AS
+            SELECT
+                CAST(timestamp AS DATE) AS day,
+                COUNT(*) AS events,
+                COUNT_IF({is_revenue_event}) AS revenue_events,
+                COUNT_IF(({is_revenue_event}) AND {missing_revenue}) AS missing_revenue_events
+            FROM {events}
+            GROUP BY 1;
+            """
+        )
+        self._daily_events_ready = True
+
+    def _fetch_metrics(self, parts: dict[str, str], *, daily_events: bool = False) -> dict[str, tuple[Any, ...]]:
+        """Runs the metric parts as one UNION ALL query; returns {key: (day, n1, n2, value)}."""
+        if not parts:
+            return {}
+        if daily_events:
+            self._ensure_daily_events()
+        union = "\nUNION ALL\n".join(
+            f"SELECT '{key}' AS check_key, CAST(day AS DATE) AS day, CAST(n1 AS BIGINT) AS n1, "
+            f"CAST(n2 AS BIGINT) AS n2, CAST(value AS DOUBLE) AS value FROM ({sql})"
+            for key, sql in parts.items()
+        )
+        rows = self.conn.execute(union).fetchall()
+        return {row[0]: row[1:] for row in rows}
 
     # ----------------------------
     # Check A: Infrastructure & Logs
     # ----------------------------
-    def check_logs_present_today(self) -> CheckResult:
-        if not self._table_exists("pipeline_logs"):
-            return CheckResult("A1 pipeline_logs exists", False, "missing table pipeline_logs")
+    def _logs_today_sql(self) -> str:
+        return """
+            SELECT NULL AS day, COUNT(*) AS n1, NULL AS n2, NULL AS value
+            FROM pipeline_logs WHERE CAST(run_timestamp AS DATE) = CURRENT_DATE
+            """.strip()
 
-        count_today = self._count("SELECT COUNT(*) FROM pipeline_logs WHERE CAST(run_timestamp AS DATE) = CURRENT_DATE;")
+    def _logs_today_result(self, metric: Optional[tuple[Any, ...]]) -> CheckResult:
+        count_today = 0 if metric is None else int(metric[1])
         return CheckResult(
             "A1 logs present today",
             count_today > 0,
             f"logs_today={count_today}",
         )
 
-    def check_quarantine_rate_today(self, max_rate: float = 0.05) -> CheckResult:
+    def check_logs_present_today(self) -> CheckResult:
         if not self._table_exists("pipeline_logs"):
-            return CheckResult("A2 quarantine rate today", False, "missing table pipeline_logs")
+            return CheckResult("A1 pipeline_logs exists", False, "missing table pipeline_logs")
+        return self._logs_today_result(self._fetch_metrics({"A1": self._logs_today_sql()}).get("A1"))
 
-        headers, row = self._fetchone(
-            """
+    def _quarantine_rate_sql(self) -> str:
+        return """
             SELECT
-            SUM(rows_read) AS rows_read,
-            SUM(rows_quarantined) AS rows_quarantined,
-            SUM(rows_quarantined) * 1.0 / NULLIF(SUM(rows_read), 0) AS quarantine_rate
+            NULL AS day,
+            SUM(rows_read) AS n1,
+            SUM(rows_quarantined) AS n2,
+            SUM(rows_quarantined) * 1.0 / NULLIF(SUM(rows_read), 0) AS value
             FROM pipeline_logs
-            WHERE CAST(run_timestamp AS DATE) = CURRENT_DATE;
+            WHERE CAST(run_timestamp AS DATE) = CURRENT_DATE
             """.strip()
-        )
-        if not row:
+
+    def _quarantine_rate_result(self, metric: Optional[tuple[Any, ...]], max_rate: float = 0.05) -> CheckResult:
+        if metric is None:
             return CheckResult("A2 quarantine rate today", False, "no rows")
 
-        rows_read, rows_quarantined, rate = row[0], row[1], row[2]
+        _, rows_read, rows_quarantined, rate = metric
         if rows_read is None or int(rows_read) == 0:
             return CheckResult("A2 quarantine rate today", False, "rows_read=0")
         if rate is None:
@@ -97,15 +163,19 @@ class DataMonitor:
             f"rows_read={int(rows_read)}, rows_quarantined={int(rows_quarantined)}, rate={float(rate):.4f} (max {max_rate:.2f})",
         )
 
+    def check_quarantine_rate_today(self, max_rate: float = 0.05) -> CheckResult:
+        if not self._table_exists("pipeline_logs"):
+            return CheckResult("A2 quarantine rate today", False, "missing table pipeline_logs")
+        metric = self._fetch_metrics({"A2": self._quarantine_rate_sql()}).get("A2")
+        return self._quarantine_rate_result(metric, max_rate)
+
     def check_no_quarantine_files_today(self) -> CheckResult:
         self.quarantine_dir.mkdir(parents=True, exist_ok=True)
         today = date.today()
-        patterns = [today.strftime("%Y%m%d"), today.strftime("%Y-%m-%d")]
-        matches: list[str] = []
-        for path in self.quarantine_dir.glob("*"):
-            name = path.name
-            if any(p in name for p in patterns):
-                matches.append(name)
+        today_re = re.compile(f"{today:%Y%m%d}|{today:%Y-%m-%d}")
+        # One scandir pass; the date match runs in the C regex engine, no Path per entry.
+        with os.scandir(self.quarantine_dir) as entries:
+            matches = [entry.name for entry in entries if today_re.search(entry.name)]
         return CheckResult(
             "A3 no quarantine files for today",
             len(matches) == 0,
@@ -115,113 +185,113 @@ class DataMonitor:
     # ----------------------------
     # Check B: Business SQL Monitors
     # ----------------------------
-    def _events_table(self) -> str:
+    @cached_property
+    def events_table(self) -> str:
         if self._table_exists("stg_events"):
             return "stg_events"
         if self._table_exists("raw_events"):
             return "raw_events"
         raise RuntimeError("No events table found (expected stg_events or raw_events)")
 
-    def _orders_table(self) -> tuple[str, str]:
+    @cached_property
+    def orders_table(self) -> tuple[str, str]:
         if self._table_exists("fct_orders"):
             return ("fct_orders", "session_id")
         if self._table_exists("fct_attribution"):
             return ("fct_attribution", "lc_session_id")
         raise RuntimeError("No orders table found (expected fct_orders or fct_attribution)")
 
-    def q41a_freshness(self) -> CheckResult:
-        events = self._events_table()
-        headers, row = self._fetchone(
-            f"""
-            SELECT CAST(timestamp AS DATE) AS day, COUNT(*) AS event_count
-            FROM {events}
-            GROUP BY 1 ORDER BY day DESC LIMIT 1;
+    def _freshness_sql(self) -> str:
+        return """
+            SELECT day, events AS n1, NULL AS n2, NULL AS value
+            FROM mon_daily_events
+            ORDER BY day DESC LIMIT 1
             """.strip()
-        )
-        if not row:
+
+    def _freshness_result(self, metric: Optional[tuple[Any, ...]]) -> CheckResult:
+        if metric is None:
             return CheckResult("Q4.1.a freshness", False, "no data")
-        day, event_count = row[0], row[1]
+        day, event_count = metric[0], metric[1]
         passed = event_count is not None and int(event_count) > 0
         return CheckResult("Q4.1.a freshness", passed, f"day={day}, event_count={event_count}")
 
-    def q41b_volume_anomaly(self, max_abs_z: float = 3.0) -> CheckResult:
-        events = self._events_table()
-        headers, row = self._fetchone(
-            f"""
-            WITH daily AS (
-                SELECT CAST(timestamp AS DATE) AS day, COUNT(*) AS events
-                FROM {events}
-                GROUP BY 1
-            ),
-            scored AS (
+    def q41a_freshness(self) -> CheckResult:
+        return self._freshness_result(
+            self._fetch_metrics({"q41a": self._freshness_sql()}, daily_events=True).get("q41a")
+        )
+
+    def _volume_anomaly_sql(self) -> str:
+        return """
+            WITH scored AS (
                 SELECT day, events,
                     AVG(events) OVER (ORDER BY day ROWS BETWEEN 7 PRECEDING AND 1 PRECEDING) AS avg_prev7,
                     STDDEV_POP(events) OVER (ORDER BY day ROWS BETWEEN 7 PRECEDING AND 1 PRECEDING) AS sd_prev7
-                FROM daily
+                FROM mon_daily_events
             )
-            SELECT day, (events - avg_prev7) / NULLIF(sd_prev7, 0) AS z_score
-            FROM scored ORDER BY day DESC LIMIT 1;
+            SELECT day, NULL AS n1, NULL AS n2, (events - avg_prev7) / NULLIF(sd_prev7, 0) AS value
+            FROM scored ORDER BY day DESC LIMIT 1
             """.strip()
-        )
-        if not row:
+
+    def _volume_anomaly_result(self, metric: Optional[tuple[Any, ...]], max_abs_z: float = 3.0) -> CheckResult:
+        if metric is None:
             return CheckResult("Q4.1.b volume anomaly z-score", False, "no data")
 
-        day, z_score = row[0], row[1]
+        day, z_score = metric[0], metric[3]
         if z_score is None:
             return CheckResult("Q4.1.b volume anomaly z-score", True, f"day={day}, z_score=NULL (insufficient history)")
 
         passed = abs(float(z_score)) < max_abs_z
         return CheckResult("Q4.1.b volume anomaly z-score", passed, f"day={day}, z_score={float(z_score):.3f} (max {max_abs_z})")
 
-    def q42b_missing_revenue_rate(self, max_pct: float = 1.0) -> CheckResult:
-        events = self._events_table()
-        cols = self._table_columns(events)
-
-        if "revenue" in cols:
-            sql = f"""
-                SELECT
-                SUM(CASE WHEN revenue IS NULL THEN 1 ELSE 0 END) * 100.0 / NULLIF(COUNT(*), 0) AS pct_missing_revenue
-                FROM {events}
-                WHERE event_name = 'purchase' OR event_name = 'checkout_completed';
-                """.strip()
-        else:
-            sql = f"""
-                SELECT
-                SUM(CASE WHEN CAST(event_data AS VARCHAR) NOT LIKE '%value%' AND CAST(event_data AS VARCHAR) NOT LIKE '%price%' THEN 1 ELSE 0 END) * 100.0 / NULLIF(COUNT(*), 0) as pct_missing_revenue
-                FROM {events}
-                WHERE event_name = 'purchase' OR event_name = 'checkout_completed';
-                """.strip()
-        headers, row = self._fetchone(sql)
-        if not row:
+    def q41b_volume_anomaly(self, max_abs_z: float = 3.0) -> CheckResult:
+        metric = self._fetch_metrics({"q41b": self._volume_anomaly_sql()}, daily_events=True).get("q41b")
+        return self._volume_anomaly_result(metric, max_abs_z)
+
+    def _missing_revenue_sql(self) -> str:
+        return """
+            SELECT
+            NULL AS day,
+            NULL AS n1,
+            NULL AS n2,
+            SUM(missing_revenue_events) * 100.0 / NULLIF(SUM(revenue_events), 0) AS value
+            FROM mon_daily_events
+            """.strip()
+
+    def _missing_revenue_result(self, metric: Optional[tuple[Any, ...]], max_pct: float = 1.0) -> CheckResult:
+        if metric is None:
             return CheckResult("Q4.2.b missing revenue rate", False, "no data")
-        pct = row[0]
+        pct = metric[3]
         if pct is None:
             return CheckResult("Q4.2.b missing revenue rate", True, "pct_missing_revenue=NULL (no matching events)")
         passed = float(pct) < max_pct
         return CheckResult("Q4.2.b missing revenue rate", passed, f"pct_missing_revenue={float(pct):.4f} (max {max_pct})")
 
-    def q45a_funnel_health(self, min_engagement_rate: float = 10.0) -> CheckResult:
-        if not self._table_exists("dim_sessions"):
-            return CheckResult("Q4.5.a funnel health", False, "missing table dim_sessions")
+    def q42b_missing_revenue_rate(self, max_pct: float = 1.0) -> CheckResult:
+        metric = self._fetch_metrics({"q42b": self._missing_revenue_sql()}, daily_events=True).get("q42b")
+        return self._missing_revenue_result(metric, max_pct)
 
+    def _funnel_health_sql(self) -> Optional[str]:
+        """None when dim_sessions lacks the day/count columns."""
         cols = self._table_columns("dim_sessions")
         day_col = "session_start_at" if "session_start_at" in cols else ("started_at" if "started_at" in cols else None)
         count_col = "event_count" if "event_count" in cols else ("actions_per_session" if "actions_per_session" in cols else None)
         if day_col is None or count_col is None:
-            return CheckResult("Q4.5.a funnel health", False, "dim_sessions missing required columns")
+            return None
 
-        headers, row = self._fetchone(
-            f"""
+        return f"""
             SELECT
                 CAST({day_col} AS DATE) AS day,
-                SUM(CASE WHEN {count_col} > 1 THEN 1 ELSE 0 END) * 100.0 / NULLIF(COUNT(*), 0) as engagement_rate
+                NULL AS n1,
+                NULL AS n2,
+                COUNT_IF({count_col} > 1) * 100.0 / NULLIF(COUNT(*), 0) as value
             FROM dim_sessions
-            GROUP BY 1 ORDER BY day DESC LIMIT 1;
+            GROUP BY 1 ORDER BY day DESC LIMIT 1
             """.strip()
-        )
-        if not row:
+
+    def _funnel_health_result(self, metric: Optional[tuple[Any, ...]], min_engagement_rate: float = 10.0) -> CheckResult:
+        if metric is None:
             return CheckResult("Q4.5.a funnel health", False, "no data")
-        day, engagement_rate = row[0], row[1]
+        day, engagement_rate = metric[0], metric[3]
         if engagement_rate is None:
             return CheckResult("Q4.5.a funnel health", False, f"day={day}, engagement_rate=NULL")
         passed = float(engagement_rate) > min_engagement_rate
@@ -231,19 +301,29 @@ class DataMonitor:
             f"day={day}, engagement_rate={float(engagement_rate):.2f} (min {min_engagement_rate})",
         )
 
-    def q46a_unattributed_purchase_rate(self) -> CheckResult:
-        table, session_col = self._orders_table()
-        headers, row = self._fetchone(
-            f"""
+    def q45a_funnel_health(self, min_engagement_rate: float = 10.0) -> CheckResult:
+        if not self._table_exists("dim_sessions"):
+            return CheckResult("Q4.5.a funnel health", False, "missing table dim_sessions")
+        sql = self._funnel_health_sql()
+        if sql is None:
+            return CheckResult("Q4.5.a funnel health", False, "dim_sessions missing required columns")
+        return self._funnel_health_result(self._fetch_metrics({"q45a": sql}).get("q45a"), min_engagement_rate)
+
+    def _unattributed_purchases_sql(self) -> str:
+        table, session_col = self.orders_table
+        return f"""
             SELECT
-                COUNT(*) as total_orders,
-                SUM(CASE WHEN {session_col} IS NULL THEN 1 ELSE 0 END) as orphan_orders
-            FROM {table};
+                NULL AS day,
+                COUNT(*) as n1,
+                COUNT_IF({session_col} IS NULL) as n2,
+                NULL AS value
+            FROM {table}
             """.strip()
-        )
-        if not row:
+
+    def _unattributed_purchases_result(self, metric: Optional[tuple[Any, ...]]) -> CheckResult:
+        if metric is None:
             return CheckResult("Q4.6.a unattributed purchase rate", False, "no data")
-        total_orders, orphan_orders = row[0], row[1]
+        total_orders, orphan_orders = metric[1], metric[2]
         if total_orders is None:
             return CheckResult("Q4.6.a unattributed purchase rate", False, "total_orders=NULL")
         passed = int(orphan_orders or 0) == 0
@@ -253,21 +333,61 @@ class DataMonitor:
             f"total_orders={int(total_orders)}, orphan_orders={int(orphan_orders or 0)}",
         )
 
+    def q46a_unattributed_purchase_rate(self) -> CheckResult:
+        return self._unattributed_purchases_result(
+            self._fetch_metrics({"q46a": self._unattributed_purchases_sql()}).get("q46a")
+        )
+
     def run_all(self) -> tuple[int, list[CheckResult]]:
         failures: list[CheckResult] = []
         results: list[CheckResult] = []
 
+        # Collect the SQL of every runnable check and evaluate them in one round-trip;
+        # checks whose tables are missing resolve without SQL.
+        # Build the events rollup first so a missing events table is reported before a
+        # missing orders table, as when the checks ran one by one.
+        self._ensure_daily_events()
+        has_logs = self._table_exists("pipeline_logs")
+        has_sessions = self._table_exists("dim_sessions")
+        funnel_sql = self._funnel_health_sql() if has_sessions else None
+
+        parts: dict[str, str] = {}
+        if has_logs:
+            parts["A1"] = self._logs_today_sql()
+            parts["A2"] = self._quarantine_rate_sql()
+        parts["q41a"] = self._freshness_sql()
+        parts["q41b"] = self._volume_anomaly_sql()
+        parts["q42b"] = self._missing_revenue_sql()
+        if funnel_sql is not None:
+            parts["q45a"] = funnel_sql
+        parts["q46a"] = self._unattributed_purchases_sql()
+
+        # The quarantine directory scan touches only the filesystem, so it overlaps the
+        # metric query (whose UNION ALL branches DuckDB already runs in parallel).
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            quarantine_files = pool.submit(self.check_no_quarantine_files_today)
+            metrics = self._fetch_metrics(parts, daily_events=True)
+
         # Check A
-        results.append(self.check_logs_present_today())
-        results.append(self.check_quarantine_rate_today())
-        results.append(self.check_no_quarantine_files_today())
+        if has_logs:
+            results.append(self._logs_today_result(metrics.get("A1")))
+            results.append(self._quarantine_rate_result(metrics.get("A2")))
+        else:
+            results.append(CheckResult("A1 pipeline_logs exists", False, "missing table pipeline_logs"))
+            results.append(CheckResult("A2 quarantine rate today", False, "missing table pipeline_logs"))
+        results.append(quarantine_files.result())
 
         # Check B
-        results.append(self.q41a_freshness())
-        results.append(self.q41b_volume_anomaly())
-        results.append(self.q42b_missing_revenue_rate())
-        results.append(self.q45a_funnel_health())
-        results.append(self.q46a_unattributed_purchase_rate())
+        results.append(self._freshness_result(metrics.get("q41a")))
+        results.append(self._volume_anomaly_result(metrics.get("q41b")))
+        results.append(self._missing_revenue_result(metrics.get("q42b")))
+        if not has_sessions:
+            results.append(CheckResult("Q4.5.a funnel health", False, "missing table dim_sessions"))
+        elif funnel_sql is None:
+            results.append(CheckResult("Q4.5.a funnel health", False, "dim_sessions missing required columns"))
+        else:
+            results.append(self._funnel_health_result(metrics.get("q45a")))
+        results.append(self._unattributed_purchases_result(metrics.get("q46a")))
 
         for r in results:
             if not r.passed:
@@ -289,24 +409,33 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    if duckdb is None:
+        raise RuntimeError("duckdb is not installed (required to run monitoring)")
+
     root = _project_root()
-    monitor = DataMonitor(Path(args.db), root)
+    conn = duckdb.connect(args.db)
     try:
+        try:
+            _configure_conn(conn)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from None
+        monitor = DataMonitor(Path(args.db), root, conn=conn)
         exit_code, results = monitor.run_all()
     finally:
-        monitor.close()
+        conn.close()
 
     if exit_code == 0:
-        print("✅ MONITORING PASSED")
-        for r in results:
-            print(f"- PASS {r.name}: {r.details}")
+        lines = ["✅ MONITORING PASSED"]
+        lines.extend(f"- PASS {r.name}: {r.details}" for r in results)
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
     failures = [r for r in results if not r.passed]
-    print("❌ MONITORING FAILED: " + "; ".join(f"{f.name} ({f.details})" for f in failures))
+    lines = ["❌ MONITORING FAILED: " + "; ".join(f"{f.name} ({f.details})" for f in failures)]
     for r in results:
         prefix = "PASS" if r.passed else "FAIL"
-        print(f"- {prefix} {r.name}: {r.details}")
+        lines.append(f"- {prefix} {r.name}: {r.details}")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 1
 
 